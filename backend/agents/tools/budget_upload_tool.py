@@ -113,12 +113,27 @@ class BudgetUploadTool:
             graph_builder = GraphBuilder()
             budget_id = graph_builder.insert_budget(budget, budget_lines, user_id=user_id)
 
+            # --- Step 4: Variance from the lines already in memory ---
+            # Returned inline so callers need no follow-up variance query
+            from backend.services.budget_variance import calculate_budget_variance
+            variance = calculate_budget_variance(
+                float(budget.total_allocated),
+                float(budget.total_spent),
+                budget_data["budget_lines"],
+            )
+
             summary = (
                 f"Budget for {budget.project_name} with total allocation of "
                 f"${float(budget.total_allocated):,.2f} processed and stored (ID: {budget_id})."
             )
             if budget.validation_warnings:
                 summary += f" {len(budget.validation_warnings)} validation warning(s) noted."
+            if variance["overrun_lines"] or variance["at_risk_lines"]:
+                summary += (
+                    f" Overall variance {variance['overall_variance']:+.1f}%;"
+                    f" {len(variance['overrun_lines'])} line(s) over budget,"
+                    f" {len(variance['at_risk_lines'])} above 90% utilization."
+                )
 
             logger.debug(
                 "budget_upload_tool_success",
@@ -134,6 +149,9 @@ class BudgetUploadTool:
                 "total_allocated": float(budget.total_allocated),
                 "total_spent": float(budget.total_spent),
                 "line_count": budget.line_count,
+                "overall_variance": variance["overall_variance"],
+                "overrun_lines": variance["overrun_lines"],
+                "at_risk_lines": variance["at_risk_lines"],
                 "summary": summary,
             }
 
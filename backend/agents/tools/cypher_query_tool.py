@@ -5,7 +5,11 @@ Core domain tool for querying invoices, contracts, budgets, projects, and contra
 Generates and executes Cypher queries based on natural language actions.
 """
 
+import hashlib
+import json
 import re
+from backend.core.cache import TTLCache
+from backend.core.config import settings
 from backend.core.logging import get_logger
 from typing import Dict, Any, Optional, List
 from datetime import date, datetime
@@ -18,6 +22,12 @@ from backend.agents.prompts.prompt_manager import render_prompt
 
 logger = get_logger(__name__)
 
+# Generated Cypher keyed by a hash of model + rendered prompt, so repeated
+# actions skip the LLM round-trip. Only the query text is cached, and only
+# once it has executed successfully; it is executed fresh each time, and the
+# user filter is injected after lookup.
+_cypher_cache = TTLCache(ttl=3600)
+
 
 class CypherQueryResponse(BaseModel):
     """Pydantic model for structuring LLM-generated Cypher queries."""
@@ -71,19 +81,19 @@ class CypherQueryTool:
         logger.debug("cypher_tool_executing", action=action[:100])
 
         # Generate Cypher query from action
-        cypher_query = self._generate_cypher(action, query, context, user_id)
+        generated, cache_key = self._generate_cypher(action, query, context, user_id)
 
-        if not cypher_query:
+        if not generated:
             return {
                 "error": "Failed to generate Cypher query",
                 "action": action,
                 "status": "failed",
             }
 
-        logger.debug("cypher_generated", query=cypher_query[:200])
+        logger.debug("cypher_generated", query=generated[:200])
 
         # Inject user_id filter in code — never trust the LLM to do it
-        cypher_query, params = self._inject_user_filter(cypher_query, user_id)
+        cypher_query, params = self._inject_user_filter(generated, user_id)
         logger.debug("cypher_user_filter_applied", user_id=user_id)
 
         # Execute query
@@ -95,6 +105,9 @@ class CypherQueryTool:
 
             logger.debug("cypher_executed", result_count=len(serialized_results))
 
+            if cache_key:
+                _cypher_cache.set(cache_key, generated)
+
             return {
                 "cypher_query": cypher_query,
                 "results": serialized_results,
@@ -104,6 +117,9 @@ class CypherQueryTool:
 
         except Exception as e:
             logger.error("cypher_execution_failed", error=str(e), query=cypher_query)
+            # Never serve a query that failed to run for identical prompts
+            if cache_key:
+                _cypher_cache.invalidate(cache_key)
             return {
                 "error": str(e),
                 "cypher_query": cypher_query,
@@ -140,7 +156,7 @@ class CypherQueryTool:
         original_query: str,
         context: Optional[Dict[str, Any]] = None,
         user_id: str = "default_user",
-    ) -> str:
+    ) -> tuple[str, Optional[str]]:
         """
         Generate Cypher query from natural language action.
 
@@ -150,7 +166,8 @@ class CypherQueryTool:
             context: Previous results for ReAct mode
 
         Returns:
-            Cypher query string
+            (Cypher query string, cache key or None when caching is disabled).
+            The caller stores the query under the key once it has executed.
         """
         # Build context from previous results if in ReAct mode
         context_info = None
@@ -165,6 +182,16 @@ class CypherQueryTool:
             context_info=context_info,
         )
 
+        cache_key = None
+        if settings.cypher_cache_enabled:
+            cache_key = hashlib.sha256(
+                json.dumps({"model": self.llm.model, "prompt": prompt}).encode("utf-8")
+            ).hexdigest()
+            cached = _cypher_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("cypher_cache_hit", action=action[:100])
+                return cached, cache_key
+
         try:
             # Get LLM to generate Cypher with Pydantic validation
             response = self.llm.extract_json(
@@ -198,11 +225,11 @@ class CypherQueryTool:
             cypher = cypher.replace("```cypher", "").replace("```", "")
             cypher = cypher.strip()
 
-            return cypher
+            return cypher, cache_key
 
         except Exception as e:
             logger.error("cypher_generation_failed", error=str(e))
-            return ""
+            return "", cache_key
 
     # Labels whose nodes carry a user_id property
     _USER_SCOPED_LABELS = {"Invoice", "Contract", "Budget", "BudgetLine"}
@@ -10,6 +10,7 @@ from backend.api.schemas import (
     BudgetVarianceResponse,
 )
 from backend.core.cache import TTLCache
+from backend.services.budget_variance import calculate_budget_variance
 from backend.services.graph_builder import GraphBuilder
 
 router = APIRouter(prefix="/budgets", tags=["budgets"])
@@ -107,50 +108,16 @@ async def get_budget_variance(budget_id: str, _: dict = Depends(get_current_user
         if not budget_data:
             raise HTTPException(status_code=404, detail="Budget not found")
 
-        total_allocated = budget_data["total_allocated"]
-        total_spent = budget_data["total_spent"]
-        overall_variance = (
-            ((total_spent - total_allocated) / total_allocated * 100)
-            if total_allocated > 0
-            else 0
+        variance = calculate_budget_variance(
+            budget_data["total_allocated"],
+            budget_data["total_spent"],
+            budget_data["budget_lines"],
         )
-
-        line_variances, overrun_lines, underrun_lines, at_risk_lines = [], [], [], []
-        for line in budget_data["budget_lines"]:
-            allocated, spent = line["allocated"], line["spent"]
-            variance_pct = (
-                ((spent - allocated) / allocated * 100) if allocated > 0 else 0
-            )
-            variance_amt = spent - allocated
-            utilization_pct = (spent / allocated * 100) if allocated > 0 else 0
-            line_variances.append(
-                {
-                    "cost_code": line["cost_code"],
-                    "description": line["description"],
-                    "allocated": allocated,
-                    "spent": spent,
-                    "variance_percent": round(variance_pct, 2),
-                    "variance_amount": round(variance_amt, 2),
-                    "utilization_percent": round(utilization_pct, 2),
-                }
-            )
-            if variance_amt > 0:
-                overrun_lines.append(line["cost_code"])
-            elif variance_amt < 0:
-                underrun_lines.append(line["cost_code"])
-            if utilization_pct > 90:
-                at_risk_lines.append(line["cost_code"])
-
         result = BudgetVarianceResponse(
             budget_id=budget_id,
             project_id=budget_data["project_id"],
             project_name=budget_data["project_name"],
-            overall_variance=round(overall_variance, 2),
-            overall_variance_amount=round(total_spent - total_allocated, 2),
-            line_variances=line_variances,
-            overrun_lines=overrun_lines,
-            underrun_lines=underrun_lines,
-            at_risk_lines=at_risk_lines,
+            **variance,
         )
         _variance_cache.set(budget_id, result)
         return result
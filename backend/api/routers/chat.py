@@ -1,7 +1,9 @@
 """Chat endpoints — unified message + file upload, streaming and non-streaming."""
 
+import hashlib
 import time
 import tempfile
+from itertools import islice
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -13,6 +15,7 @@ from fastapi.responses import StreamingResponse
 from backend.agents.orchestrator import create_multi_agent_graph
 from backend.api.schemas import ChatResponse, ChatStreamEvent
 from backend.auth.dependencies import get_current_user
+from backend.core.cache import TTLCache
 from backend.core.config import settings
 from backend.memory.conversation_store import ConversationStore
 from backend.memory.mem0_client import Mem0Client
@@ -20,6 +23,11 @@ from backend.memory.mem0_client import Mem0Client
 router = APIRouter(tags=["chat"])
 logger = get_logger(__name__)
 
+# Upload previews keyed by file type + content hash; re-uploads skip parsing
+_preview_cache = TTLCache(ttl=600)
+
+_UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
 # ── Non-streaming ──────────────────────────────────────────────────────────────
 
 
@@ -69,21 +77,19 @@ async def chat(
         if files:
             logger.info("chat_upload_request_received", file_count=len(files))
             file_descriptions = []
+            previews = []
             for uploaded_file in files:
-                suffix = Path(uploaded_file.filename).suffix or ".tmp"
-                content = await uploaded_file.read()
-                if len(content) > settings.api_upload_max_size:
+                tmp_path, digest, too_large = await _spool_upload(uploaded_file)
+                temp_paths.append(tmp_path)
+                if too_large:
                     raise HTTPException(
                         status_code=413,
                         detail=f"File '{uploaded_file.filename}' too large. "
                         f"Maximum size: {settings.api_upload_max_size} bytes",
                     )
-                with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                    tmp.write(content)
-                    tmp_path = tmp.name
-                temp_paths.append(tmp_path)
                 uploaded_filenames.append(uploaded_file.filename)
                 file_descriptions.append(f"- {uploaded_file.filename} → {tmp_path}")
+                previews.append(_cached_file_preview(tmp_path, digest))
                 logger.debug(
                     "chat_upload_temp_saved",
                     filename=uploaded_file.filename,
@@ -91,8 +97,7 @@ async def chat(
                 )
 
             file_previews = []
-            for desc, tmp_path in zip(file_descriptions, temp_paths):
-                preview = _extract_file_preview(tmp_path)
+            for desc, preview in zip(file_descriptions, previews):
                 file_previews.append(
                     f"{desc}\n  Content preview: {preview}" if preview else desc
                 )
@@ -350,10 +355,11 @@ async def chat_stream(
             if files:
                 logger.info("chat_stream_upload_start", file_count=len(files))
                 file_descriptions = []
+                previews = []
                 for uploaded_file in files:
-                    suffix = Path(uploaded_file.filename).suffix or ".tmp"
-                    content = await uploaded_file.read()
-                    if len(content) > settings.api_upload_max_size:
+                    tmp_path, digest, too_large = await _spool_upload(uploaded_file)
+                    temp_paths.append(tmp_path)
+                    if too_large:
                         error_event = ChatStreamEvent(
                             event="error",
                             data={
@@ -364,14 +370,9 @@ async def chat_stream(
                         )
                         yield f"data: {error_event.model_dump_json()}\n\n"
                         return
-                    with tempfile.NamedTemporaryFile(
-                        delete=False, suffix=suffix
-                    ) as tmp:
-                        tmp.write(content)
-                        tmp_path = tmp.name
-                    temp_paths.append(tmp_path)
                     uploaded_filenames.append(uploaded_file.filename)
                     file_descriptions.append(f"- {uploaded_file.filename} → {tmp_path}")
+                    previews.append(_cached_file_preview(tmp_path, digest))
                     logger.debug(
                         "chat_stream_temp_saved",
                         filename=uploaded_file.filename,
@@ -379,8 +380,7 @@ async def chat_stream(
                     )
 
                 file_previews = []
-                for desc, tmp_path in zip(file_descriptions, temp_paths):
-                    preview = _extract_file_preview(tmp_path)
+                for desc, preview in zip(file_descriptions, previews):
                     file_previews.append(
                         f"{desc}\n  Content preview: {preview}" if preview else desc
                     )
@@ -697,6 +697,38 @@ def _create_event_data(
     return None
 
 
+async def _spool_upload(uploaded_file: UploadFile) -> tuple[str, str, bool]:
+    """
+    Copy an upload to a temp file in fixed-size chunks.
+
+    Returns (temp path, SHA-256 hex digest, too_large). Copying stops as soon
+    as the size limit is exceeded; the caller owns the temp file either way.
+    """
+    suffix = Path(uploaded_file.filename).suffix or ".tmp"
+    digest = hashlib.sha256()
+    size = 0
+    too_large = False
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        while chunk := await uploaded_file.read(_UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > settings.api_upload_max_size:
+                too_large = True
+                break
+            digest.update(chunk)
+            tmp.write(chunk)
+    return tmp.name, digest.hexdigest(), too_large
+
+
+def _cached_file_preview(file_path: str, digest: str) -> str:
+    """Return the content preview for an upload, reusing it for identical files."""
+    key = f"{Path(file_path).suffix.lower()}:{digest}"
+    preview = _preview_cache.get(key)
+    if preview is None:
+        preview = _extract_file_preview(file_path)
+        _preview_cache.set(key, preview)
+    return preview
+
+
 def _extract_file_preview(file_path: str, max_chars: int = 500) -> str:
     """Extract a short text preview from a file for content-based classification."""
     try:
@@ -715,11 +747,28 @@ def _extract_file_preview(file_path: str, max_chars: int = 500) -> str:
                 return text[:max_chars].strip()
 
         if suffix == ".csv":
+            # Stop after the first lines instead of scanning the whole file
             with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                lines = [line.rstrip() for i, line in enumerate(f) if i < 5]
+                lines = [line.rstrip() for line in islice(f, 5)]
             return "\n".join(lines)[:max_chars]
 
-        if suffix in (".xlsx", ".xls"):
+        if suffix == ".xlsx":
+            import pandas as pd
+            from openpyxl import load_workbook
+
+            # Read-only mode streams rows instead of building the full workbook
+            wb = load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                rows = list(wb.worksheets[0].iter_rows(max_row=4, values_only=True))
+            finally:
+                wb.close()
+            if not rows:
+                return ""
+            columns = [str(c) for c in rows[0]]
+            df = pd.DataFrame(rows[1:], columns=columns)
+            return f"Columns: {', '.join(columns)}\n{df.to_string()}"[:max_chars]
+
+        if suffix == ".xls":
             import pandas as pd
 
             df = pd.read_excel(file_path, nrows=5)
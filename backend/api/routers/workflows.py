@@ -11,6 +11,7 @@ from backend.api.schemas import (
     ValidationAnomalyResponse,
     WorkflowResumeRequest,
     WorkflowStatusResponse,
+    WorkflowSummaryResponse,
 )
 from backend.auth.dependencies import get_current_user
 from backend.services.workflow_manager import WorkflowManager
@@ -20,6 +21,9 @@ logger = get_logger(__name__)
 
 _workflow_manager: WorkflowManager | None = None
 
+# Ascending severity; used to expand a min_severity filter into risk levels
+_SEVERITY_ORDER = ["low", "medium", "high", "critical"]
+
 
 def get_workflow_manager() -> WorkflowManager:
     global _workflow_manager
@@ -29,12 +33,28 @@ def get_workflow_manager() -> WorkflowManager:
 
 
 @router.get("/quarantined", response_model=List[QuarantinedWorkflowResponse])
-async def get_quarantined_workflows(current_user: dict = Depends(get_current_user)):
-    """Get all workflows awaiting human review."""
+async def get_quarantined_workflows(
+    min_severity: Optional[str] = None,
+    current_user: dict = Depends(get_current_user),
+):
+    """Get all workflows awaiting human review, optionally at or above a risk level."""
     user_id = current_user["id"]
-    logger.debug("quarantined_workflows_requested", user_id=user_id)
+    logger.debug(
+        "quarantined_workflows_requested", user_id=user_id, min_severity=min_severity
+    )
+    risk_levels = None
+    if min_severity:
+        min_severity = min_severity.lower()
+        if min_severity not in _SEVERITY_ORDER:
+            raise HTTPException(
+                status_code=400,
+                detail=f"min_severity must be one of {', '.join(_SEVERITY_ORDER)}",
+            )
+        risk_levels = _SEVERITY_ORDER[_SEVERITY_ORDER.index(min_severity):]
     try:
-        workflows = get_workflow_manager().get_quarantined_workflows(user_id=user_id)
+        workflows = get_workflow_manager().get_quarantined_workflows(
+            user_id=user_id, risk_levels=risk_levels
+        )
         responses = []
         for wf in workflows:
             state = wf["state"]
@@ -144,18 +164,41 @@ async def get_workflow_status(
         )
 
 
+@router.get("/summary", response_model=WorkflowSummaryResponse)
+async def get_workflow_summary(current_user: dict = Depends(get_current_user)):
+    """Get workflow counts by status, aggregated in the database."""
+    user_id = current_user["id"]
+    logger.debug("workflow_summary_requested", user_id=user_id)
+    try:
+        return WorkflowSummaryResponse(
+            **get_workflow_manager().get_workflow_summary(user_id=user_id)
+        )
+    except Exception as e:
+        logger.error("workflow_summary_failed", error=str(e))
+        raise HTTPException(
+            status_code=500, detail=f"Failed to get workflow summary: {e}"
+        )
+
+
 @router.get("")
 async def list_workflows(
     status: Optional[str] = None,
     limit: int = 100,
+    offset: int = 0,
     current_user: dict = Depends(get_current_user),
 ):
-    """List all workflows, optionally filtered by status."""
+    """List workflows newest first, optionally filtered by status."""
     user_id = current_user["id"]
-    logger.debug("workflows_list_requested", status=status, limit=limit, user_id=user_id)
+    logger.debug(
+        "workflows_list_requested",
+        status=status,
+        limit=limit,
+        offset=offset,
+        user_id=user_id,
+    )
     try:
         return get_workflow_manager().list_workflows(
-            status=status, limit=limit, user_id=user_id
+            status=status, limit=limit, user_id=user_id, offset=offset
         )
     except Exception as e:
         logger.error("workflows_list_failed", error=str(e))
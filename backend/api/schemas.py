@@ -97,6 +97,16 @@ class QuarantinedWorkflowResponse(BaseModel):
     updated_at: str
 
 
+class WorkflowSummaryResponse(BaseModel):
+    """Workflow counts by status."""
+
+    total: int
+    completed: int
+    processing: int
+    failed: int
+    quarantined: int
+
+
 class WorkflowResumeRequest(BaseModel):
     """Request to resume a quarantined workflow."""
 
@@ -37,6 +37,10 @@ class TTLCache:
     def invalidate(self, key: str) -> None:
         self._store.pop(key, None)
 
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._store.clear()
+
     def invalidate_prefix(self, prefix: str) -> None:
         """Remove all keys that start with prefix."""
         stale = [k for k in self._store if k.startswith(prefix)]
@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     # Anthropic (for Cypher query tool)
     anthropic_api_key: str
     anthropic_model: str = "claude-haiku-4-5-20251001"  # For Cypher query generation
+    cypher_cache_enabled: bool = True  # Reuse generated Cypher for identical prompts
 
     # Web Search
     tavily_api_key: Optional[str] = None  # Optional for WebSearchTool
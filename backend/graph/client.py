@@ -57,24 +57,41 @@ class Neo4jClient:
     def run_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict]:
         """Execute Cypher query and return results with Neo4j objects serialized."""
         with self.driver.session() as session:
-            result = session.run(query, parameters or {})
-            records = []
-            for record in result:
-                # Serialize each value in the record
-                serialized_record = {}
-                for key in record.keys():
-                    value = record[key]
-                    serialized_record[key] = self._serialize_neo4j_value(value)
-                records.append(serialized_record)
-            return records
+            return self._serialize_records(session.run(query, parameters or {}))
 
-    def run_migration(self, cypher_file_path: str):
-        """Execute migration script"""
+    def _serialize_records(self, result) -> List[Dict]:
+        """Serialize every value of every record in a query result."""
+        records = []
+        for record in result:
+            serialized_record = {}
+            for key in record.keys():
+                value = record[key]
+                serialized_record[key] = self._serialize_neo4j_value(value)
+            records.append(serialized_record)
+        return records
+
+    @staticmethod
+    def _run_script(session, cypher_file_path: str):
         with open(cypher_file_path, 'r') as f:
             queries = f.read().split(';')
 
+        for query in queries:
+            query = query.strip()
+            if query:
+                session.run(query)
+
+    def run_migration(self, cypher_file_path: str):
+        """Execute migration script"""
+        with self.driver.session() as session:
+            self._run_script(session, cypher_file_path)
+
+    def run_script_then_query(self, cypher_file_path: str, query: str) -> List[Dict]:
+        """Execute a migration script, then a follow-up query, on one session.
+
+        Schema statements cannot share an explicit transaction with other
+        queries, so each runs auto-commit; reusing the session keeps them on
+        one pooled connection instead of checking out two.
+        """
         with self.driver.session() as session:
-            for query in queries:
-                query = query.strip()
-                if query:
-                    session.run(query)
+            self._run_script(session, cypher_file_path)
+            return self._serialize_records(session.run(query))
@@ -94,7 +94,12 @@ class BudgetExtractor:
                 df = pd.read_excel(file_path, sheet_name=0)
 
         elif suffix == ".csv":
-            df = pd.read_csv(file_path)
+            # pyarrow's multithreaded reader is much faster on large budgets;
+            # fall back to the C engine if pyarrow is missing or rejects the file
+            try:
+                df = pd.read_csv(file_path, engine="pyarrow")
+            except (ImportError, ValueError):
+                df = pd.read_csv(file_path)
 
         else:
             raise ValueError(f"Unsupported file format: {suffix}. Use .xlsx, .xls, or .csv")
@@ -1,10 +1,13 @@
 """Contract extraction agent - converts PDF to structured Contract model via Groq/Llama3."""
 
+import copy
+import hashlib
 import json
 from pathlib import Path
 from typing import List, Optional
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+from backend.core.cache import TTLCache
 from backend.core.logging import get_logger
 import pdfplumber
 from pypdf import PdfReader
@@ -14,6 +17,9 @@ from backend.services.llm_client import GroqClient
 
 logger = get_logger(__name__)
 
+# structure_contract results by SHA-256 of the PDF text (1h)
+_structured_cache = TTLCache(ttl=3600)
+
 
 class ContractExtractor:
     """Extract structured contract data from PDF files using Groq/Llama3."""
@@ -62,16 +68,24 @@ class ContractExtractor:
 
         raise ValueError(f"Failed to extract text from PDF: {pdf_path}")
 
-    def structure_contract(self, raw_text: str) -> dict:
+    def structure_contract(self, raw_text: str, use_cache: bool = True) -> dict:
         """
         Use Groq/Llama3 to extract structured contract data from raw text.
 
         Args:
             raw_text: Extracted PDF text
+            use_cache: Reuse/store the result for identical text; pass False
+                to force a fresh extraction
 
         Returns:
             Dictionary matching Contract schema
         """
+        cache_key = hashlib.sha256(raw_text.encode("utf-8")).hexdigest()
+        cached = _structured_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            logger.debug("contract_structure_cache_hit", text_length=len(raw_text))
+            return copy.deepcopy(cached)
+
         prompt = f"""You are a construction contract analysis AI. Extract structured contract terms from the PDF text below.
 
 OUTPUT SCHEMA:
@@ -115,6 +129,8 @@ Extract the contract data now:
             contract_id=result.get("contract_id"),
             cost_codes_count=len(result.get("approved_cost_codes", [])),
         )
+        if use_cache:
+            _structured_cache.set(cache_key, copy.deepcopy(result))
         return result
 
     def validate_extracted_contract(self, data: dict) -> List[str]:
@@ -1,8 +1,11 @@
 """Invoice extraction agent - converts PDF to structured Invoice model."""
 
+import copy
+import hashlib
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
+from backend.core.cache import TTLCache
 from backend.core.logging import get_logger
 import pdfplumber
 from pypdf import PdfReader
@@ -12,6 +15,10 @@ from backend.services.llm_client import GroqClient
 
 logger = get_logger(__name__)
 
+# Structured LLM output keyed by a hash of the source text, so re-uploading
+# the same document skips the LLM round-trip
+_structured_cache = TTLCache(ttl=3600)
+
 
 class InvoiceExtractor:
     """Extract structured invoice data from PDF files."""
@@ -74,16 +81,24 @@ class InvoiceExtractor:
 
         raise ValueError(f"Failed to extract text from PDF: {pdf_path}")
 
-    def structure_invoice(self, raw_text: str) -> dict:
+    def structure_invoice(self, raw_text: str, use_cache: bool = True) -> dict:
         """
         Use Groq LLM to extract structured invoice data from raw text.
 
         Args:
             raw_text: Extracted PDF text
+            use_cache: Reuse/store the result for identical text. Retries pass
+                False so they never get back the extraction being corrected.
 
         Returns:
             Dictionary matching Invoice schema
         """
+        cache_key = hashlib.sha256(raw_text.encode("utf-8")).hexdigest()
+        cached = _structured_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            logger.debug("invoice_structure_cache_hit", text_length=len(raw_text))
+            return copy.deepcopy(cached)
+
         prompt = f"""You are a financial document extraction AI. Extract structured invoice data from the PDF text below.
 
 OUTPUT SCHEMA:
@@ -130,6 +145,8 @@ Extract the invoice data now:
             invoice_number=result.get("invoice_number"),
             line_items_count=len(result.get("line_items", [])),
         )
+        if use_cache:
+            _structured_cache.set(cache_key, copy.deepcopy(result))
         return result
 
     def extract_invoice_from_pdf(self, pdf_path: Path) -> Invoice:
@@ -88,10 +88,13 @@ def structure_invoice_node(state: WorkflowState) -> Dict[str, Any]:
 
         # If this is a retry, incorporate critic feedback
         raw_text = state["raw_text"]
-        if state.get("critic_feedback"):
+        is_retry = bool(state.get("critic_feedback"))
+        if is_retry:
             raw_text = f"{raw_text}\n\nCRITIC FEEDBACK (FIX THESE ISSUES):\n{state['critic_feedback']}"
 
-        invoice_data = extractor.structure_invoice(raw_text)
+        # Retries bypass the extraction cache: repeated feedback must not
+        # return the same rejected extraction
+        invoice_data = extractor.structure_invoice(raw_text, use_cache=not is_retry)
 
         # Calculate confidence based on completeness
         confidence = _calculate_extraction_confidence(invoice_data)
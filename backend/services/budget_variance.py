@@ -0,0 +1,61 @@
+"""Budget variance calculations shared by the budgets API and budget ingestion."""
+
+from typing import Any, Dict, Iterable
+
+
+def calculate_budget_variance(
+    total_allocated: float,
+    total_spent: float,
+    budget_lines: Iterable[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Compute overall and per-cost-code variance (budget vs actual spend).
+
+    Args:
+        total_allocated: Total budget allocation
+        total_spent: Total amount spent
+        budget_lines: Dicts with cost_code, description, allocated and spent
+
+    Returns:
+        Dict with overall_variance (%), overall_variance_amount, line_variances,
+        and the overrun_lines / underrun_lines / at_risk_lines cost codes
+        (at risk = more than 90% of the line allocation spent).
+    """
+    overall_variance = (
+        ((total_spent - total_allocated) / total_allocated * 100)
+        if total_allocated > 0
+        else 0
+    )
+
+    line_variances, overrun_lines, underrun_lines, at_risk_lines = [], [], [], []
+    for line in budget_lines:
+        allocated, spent = float(line["allocated"]), float(line["spent"])
+        variance_pct = ((spent - allocated) / allocated * 100) if allocated > 0 else 0
+        variance_amt = spent - allocated
+        utilization_pct = (spent / allocated * 100) if allocated > 0 else 0
+        line_variances.append(
+            {
+                "cost_code": line["cost_code"],
+                "description": line["description"],
+                "allocated": allocated,
+                "spent": spent,
+                "variance_percent": round(variance_pct, 2),
+                "variance_amount": round(variance_amt, 2),
+                "utilization_percent": round(utilization_pct, 2),
+            }
+        )
+        if variance_amt > 0:
+            overrun_lines.append(line["cost_code"])
+        elif variance_amt < 0:
+            underrun_lines.append(line["cost_code"])
+        if utilization_pct > 90:
+            at_risk_lines.append(line["cost_code"])
+
+    return {
+        "overall_variance": round(overall_variance, 2),
+        "overall_variance_amount": round(total_spent - total_allocated, 2),
+        "line_variances": line_variances,
+        "overrun_lines": overrun_lines,
+        "underrun_lines": underrun_lines,
+        "at_risk_lines": at_risk_lines,
+    }
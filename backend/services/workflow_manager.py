@@ -279,17 +279,23 @@ class WorkflowManager:
         """
         return self.store.get_workflow(document_id)
 
-    def get_quarantined_workflows(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_quarantined_workflows(
+        self,
+        user_id: Optional[str] = None,
+        risk_levels: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Get all workflows awaiting human review, scoped to the given user.
 
         Args:
             user_id: When provided, only return workflows owned by this user.
+            risk_levels: When provided, only return workflows whose stored
+                risk level is one of these values.
 
         Returns:
             List of quarantined workflow states
         """
-        return self.store.get_all_quarantined(user_id=user_id)
+        return self.store.get_all_quarantined(user_id=user_id, risk_levels=risk_levels)
 
     def get_workflows_by_status(self, status: str, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -304,25 +310,49 @@ class WorkflowManager:
         """
         return self.store.get_all_by_status(status, user_id=user_id)
 
-    def list_workflows(self, status: Optional[str] = None, limit: int = 100, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    def get_workflow_summary(self, user_id: Optional[str] = None) -> Dict[str, int]:
         """
-        List all workflows, optionally filtered by status and owner.
+        Aggregate workflow counts by status without loading workflow states.
+
+        Args:
+            user_id: When provided, only count workflows owned by this user.
+
+        Returns:
+            Dict with total, completed, processing, failed and quarantined
+            counts. ``quarantined`` counts paused workflows awaiting review.
+        """
+        rows = self.store.count_by_status(user_id=user_id)
+        by_status = {row["status"]: row["total"] for row in rows}
+        return {
+            "total": sum(by_status.values()),
+            "completed": by_status.get("completed", 0),
+            "processing": by_status.get("processing", 0),
+            "failed": by_status.get("failed", 0),
+            "quarantined": sum(row["paused"] for row in rows),
+        }
+
+    def list_workflows(
+        self,
+        status: Optional[str] = None,
+        limit: int = 100,
+        user_id: Optional[str] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        List workflows newest first, optionally filtered by status and owner.
+
+        Sorting and paging happen in the database, so only the requested
+        page is loaded.
 
         Args:
             status: Optional status filter
             limit: Maximum number of workflows to return
             user_id: When provided, only return workflows owned by this user.
+            offset: Number of workflows to skip (for pagination)
 
         Returns:
             List of workflow states
         """
-        if status:
-            workflows = self.store.get_all_by_status(status, user_id=user_id)
-        else:
-            workflows = self.store.get_all_workflows(user_id=user_id)
-
-        # Sort by created_at descending (newest first)
-        workflows.sort(key=lambda w: w.get("created_at", ""), reverse=True)
-
-        # Apply limit
-        return workflows[:limit]
+        return self.store.list_workflows(
+            status=status, user_id=user_id, limit=limit, offset=offset
+        )
@@ -71,19 +71,26 @@ class WorkflowStore:
             }
         return None
 
-    def get_all_quarantined(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get all workflows with paused=TRUE, optionally filtered by owner."""
+    def get_all_quarantined(
+        self,
+        user_id: Optional[str] = None,
+        risk_levels: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get all workflows with paused=TRUE, optionally filtered by owner and risk level."""
+        clauses = ["paused = TRUE"]
+        params: List[Any] = []
+        if user_id:
+            clauses.append("user_id = %s")
+            params.append(user_id)
+        if risk_levels:
+            clauses.append("risk_level = ANY(%s)")
+            params.append(list(risk_levels))
         with get_pool().connection() as conn:
-            if user_id:
-                rows = conn.execute(
-                    "SELECT * FROM workflow_states WHERE paused = TRUE AND user_id = %s "
-                    "ORDER BY updated_at DESC",
-                    (user_id,),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    "SELECT * FROM workflow_states WHERE paused = TRUE ORDER BY updated_at DESC"
-                ).fetchall()
+            rows = conn.execute(
+                f"SELECT * FROM workflow_states WHERE {' AND '.join(clauses)} "
+                "ORDER BY updated_at DESC",
+                params,
+            ).fetchall()
         workflows = [
             {
                 "document_id": row["document_id"],
@@ -157,6 +164,61 @@ class WorkflowStore:
             for row in rows
         ]
 
+    def list_workflows(
+        self,
+        status: Optional[str] = None,
+        user_id: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Get one page of workflows, newest first, optionally filtered by status and owner."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if status:
+            clauses.append("status = %s")
+            params.append(status)
+        if user_id:
+            clauses.append("user_id = %s")
+            params.append(user_id)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        params.extend([limit, offset])
+        with get_pool().connection() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM workflow_states {where}"
+                "ORDER BY created_at DESC LIMIT %s OFFSET %s",
+                params,
+            ).fetchall()
+        return [
+            {
+                "document_id": row["document_id"],
+                "user_id": row["user_id"],
+                "status": row["status"],
+                "paused": row["paused"],
+                "risk_level": row["risk_level"],
+                "retry_count": row["retry_count"],
+                "state": json.loads(row["state_json"]),
+                "created_at": row["created_at"],
+                "updated_at": row["updated_at"],
+            }
+            for row in rows
+        ]
+
+    def count_by_status(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Count workflows per status (and how many of each are paused), optionally filtered by owner."""
+        where = "WHERE user_id = %s " if user_id else ""
+        params = (user_id,) if user_id else ()
+        with get_pool().connection() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS total, "
+                "COUNT(*) FILTER (WHERE paused) AS paused "
+                f"FROM workflow_states {where}GROUP BY status",
+                params,
+            ).fetchall()
+        return [
+            {"status": row["status"], "total": row["total"], "paused": row["paused"]}
+            for row in rows
+        ]
+
     def delete_workflow(self, document_id: str):
         """Delete a workflow state."""
         with get_pool().connection() as conn:
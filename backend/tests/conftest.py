@@ -1,6 +1,20 @@
 import pytest
 from backend.graph.client import Neo4jClient
 from backend.vector.client import ChromaDBClient
+from backend.agents.tools import cypher_query_tool
+from backend.ingestion import contract_extractor, extractor
+
+
+@pytest.fixture(autouse=True)
+def _clear_llm_caches():
+    """Module-level LLM result caches must not leak between tests."""
+    extractor._structured_cache.clear()
+    contract_extractor._structured_cache.clear()
+    cypher_query_tool._cypher_cache.clear()
+    yield
+    extractor._structured_cache.clear()
+    contract_extractor._structured_cache.clear()
+    cypher_query_tool._cypher_cache.clear()
 
 
 @pytest.fixture
@@ -0,0 +1,139 @@
+"""
+Unit tests for the Streamlit frontend APIClient.
+
+Tests:
+- _cached per-client memo keyed by auth token
+- get_api_client dropping cached responses when the token changes
+- Circuit breaker reporting once and returning recognisable stand-ins
+"""
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from frontend.utils import api_client as api_module
+from frontend.utils.api_client import (
+    APIClient,
+    BackendUnavailable,
+    is_degraded,
+    require_live,
+)
+
+
+def _response(content: bytes) -> Mock:
+    response = Mock()
+    response.content = content
+    response.raise_for_status = Mock()
+    return response
+
+
+class _AttrDict(dict):
+    """Stand-in for st.session_state: a dict with attribute access."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(name) from e
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+
+@pytest.fixture
+def client():
+    """APIClient with a mocked HTTP session and a silent error reporter."""
+    client = APIClient(base_url="http://backend", on_error=Mock())
+    client._session = Mock()
+    yield client
+    APIClient._record_success()
+
+
+class TestCachedByToken:
+    """Cached getters must never hand one user's data to another."""
+
+    def test_same_token_hits_cache(self, client):
+        client.token = "token-a"
+        client._session.request.return_value = _response(b'[{"id": "A"}]')
+
+        assert client.list_workflows() == [{"id": "A"}]
+        assert client.list_workflows() == [{"id": "A"}]
+        assert client._session.request.call_count == 1
+
+    def test_token_switch_misses_cache(self, client):
+        client.token = "token-a"
+        client._session.request.return_value = _response(b'[{"id": "A"}]')
+        assert client.list_workflows() == [{"id": "A"}]
+
+        client.token = "token-b"
+        client._session.request.return_value = _response(b'[{"id": "B"}]')
+        assert client.list_workflows() == [{"id": "B"}]
+        assert client._session.request.call_count == 2
+
+    def test_get_api_client_clears_cache_on_token_change(self, client):
+        session_state = _AttrDict(api=client, token="token-a")
+        client._session.request.return_value = _response(b'[{"id": "A"}]')
+
+        with patch.object(api_module.st, "session_state", session_state):
+            api_module.get_api_client().list_workflows()
+            assert client._cache
+
+            session_state["token"] = "token-b"
+            api = api_module.get_api_client()
+
+        assert api is client
+        assert api.token == "token-b"
+        assert not client._cache
+
+
+
+class TestCircuitBreaker:
+    """An outage is reported once and never looks like empty data."""
+
+    def _trip(self, client):
+        client._session.request.side_effect = requests.exceptions.ConnectionError()
+        for _ in range(api_module._BREAKER_THRESHOLD):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                client.health_check()
+        client._session.request.reset_mock()
+        client._on_error.reset_mock()
+
+    def test_open_breaker_fails_fast_and_reports_once(self, client):
+        self._trip(client)
+
+        for _ in range(3):
+            with pytest.raises(BackendUnavailable):
+                client.health_check()
+
+        client._session.request.assert_not_called()
+        client._on_error.assert_called_once()
+        assert isinstance(client._on_error.call_args.args[1], BackendUnavailable)
+
+    def test_degraded_getters_return_marked_stand_ins(self, client):
+        self._trip(client)
+
+        workflows = client.list_workflows()
+        workflow = client.get_workflow("wf-1")
+
+        assert workflows == [] and is_degraded(workflows)
+        assert workflow == {} and is_degraded(workflow)
+        with pytest.raises(BackendUnavailable):
+            require_live(workflows)
+
+    def test_real_empty_response_is_not_degraded(self, client):
+        client._session.request.return_value = _response(b"[]")
+
+        workflows = client.list_workflows()
+
+        assert workflows == [] and not is_degraded(workflows)
+        assert require_live(workflows) is workflows
+
+    def test_outage_is_not_cached(self, client):
+        self._trip(client)
+        assert is_degraded(client.list_workflows())
+
+        APIClient._record_success()
+        client._session.request.side_effect = None
+        client._session.request.return_value = _response(b'[{"id": "A"}]')
+
+        assert client.list_workflows() == [{"id": "A"}]
@@ -0,0 +1,118 @@
+"""
+Unit tests for the shared budget variance calculation.
+
+Tests:
+- Overall and per-line variance when over and under budget
+- Overrun / underrun / at-risk classification
+- Zero allocations (no division by zero)
+- Empty budget lines
+"""
+
+import pytest
+
+from backend.services.budget_variance import calculate_budget_variance
+
+
+def _line(cost_code: str, allocated: float, spent: float) -> dict:
+    return {
+        "cost_code": cost_code,
+        "description": f"Line {cost_code}",
+        "allocated": allocated,
+        "spent": spent,
+    }
+
+
+class TestCalculateBudgetVariance:
+    """Test calculate_budget_variance."""
+
+    def test_over_budget(self):
+        """Spending above allocation gives positive variance and an overrun line."""
+        result = calculate_budget_variance(
+            total_allocated=100000,
+            total_spent=120000,
+            budget_lines=[_line("05-500", 100000, 120000)],
+        )
+
+        assert result["overall_variance"] == 20.0
+        assert result["overall_variance_amount"] == 20000.0
+        assert result["overrun_lines"] == ["05-500"]
+        assert result["underrun_lines"] == []
+        assert result["at_risk_lines"] == ["05-500"]
+
+        line = result["line_variances"][0]
+        assert line["variance_percent"] == 20.0
+        assert line["variance_amount"] == 20000.0
+        assert line["utilization_percent"] == 120.0
+
+    def test_under_budget(self):
+        """Spending below allocation gives negative variance and an underrun line."""
+        result = calculate_budget_variance(
+            total_allocated=200000,
+            total_spent=150000,
+            budget_lines=[
+                _line("01-100", 100000, 50000),
+                _line("16-100", 100000, 100000),
+            ],
+        )
+
+        assert result["overall_variance"] == -25.0
+        assert result["overall_variance_amount"] == -50000.0
+        assert result["overrun_lines"] == []
+        assert result["underrun_lines"] == ["01-100"]
+        # Fully spent line is neither over nor under, but is at risk (>90%)
+        assert result["at_risk_lines"] == ["16-100"]
+
+    def test_at_risk_threshold(self):
+        """Exactly 90% utilisation is not at risk; just over is."""
+        result = calculate_budget_variance(
+            total_allocated=200,
+            total_spent=181,
+            budget_lines=[_line("A", 100, 90), _line("B", 100, 91)],
+        )
+
+        assert result["at_risk_lines"] == ["B"]
+
+    def test_zero_budget(self):
+        """Zero allocations report 0% instead of dividing by zero."""
+        result = calculate_budget_variance(
+            total_allocated=0,
+            total_spent=500,
+            budget_lines=[_line("02-200", 0, 500)],
+        )
+
+        assert result["overall_variance"] == 0
+        assert result["overall_variance_amount"] == 500.0
+        line = result["line_variances"][0]
+        assert line["variance_percent"] == 0
+        assert line["utilization_percent"] == 0
+        assert line["variance_amount"] == 500.0
+        assert result["overrun_lines"] == ["02-200"]
+        assert result["at_risk_lines"] == []
+
+    def test_empty_line_items(self):
+        """No budget lines still yields the overall figures and empty lists."""
+        result = calculate_budget_variance(
+            total_allocated=1000, total_spent=250, budget_lines=[]
+        )
+
+        assert result == {
+            "overall_variance": -75.0,
+            "overall_variance_amount": -750.0,
+            "line_variances": [],
+            "overrun_lines": [],
+            "underrun_lines": [],
+            "at_risk_lines": [],
+        }
+
+    def test_accepts_string_amounts(self):
+        """Line amounts are coerced with float(), e.g. Decimal or str from storage."""
+        result = calculate_budget_variance(
+            total_allocated=100,
+            total_spent=50,
+            budget_lines=[_line("03-300", "100", "50")],
+        )
+
+        line = result["line_variances"][0]
+        assert line["allocated"] == 100.0
+        assert line["spent"] == 50.0
+        assert line["variance_percent"] == pytest.approx(-50.0)
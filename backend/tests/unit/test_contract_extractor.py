@@ -88,6 +88,50 @@ class TestStructureContract:
             contract_extractor.structure_contract("Bad text")
 
 
+class TestStructureContractCache:
+    """Test the structured-output cache around structure_contract."""
+
+    def test_same_text_hits_cache(self, contract_extractor, valid_contract_data):
+        """Identical text is structured by the LLM only once."""
+        contract_extractor.llm_client.extract_json.return_value = valid_contract_data
+
+        first = contract_extractor.structure_contract("Contract text")
+        second = contract_extractor.structure_contract("Contract text")
+
+        assert first == second == valid_contract_data
+        contract_extractor.llm_client.extract_json.assert_called_once()
+
+    def test_different_text_misses_cache(self, contract_extractor, valid_contract_data):
+        """Different text goes back to the LLM."""
+        contract_extractor.llm_client.extract_json.return_value = valid_contract_data
+
+        contract_extractor.structure_contract("Contract text A")
+        contract_extractor.structure_contract("Contract text B")
+
+        assert contract_extractor.llm_client.extract_json.call_count == 2
+
+    def test_cached_result_is_isolated(self, contract_extractor, valid_contract_data):
+        """Mutating a returned result never changes what the cache serves."""
+        contract_extractor.llm_client.extract_json.return_value = valid_contract_data
+
+        first = contract_extractor.structure_contract("Contract text")
+        first["approved_cost_codes"].append("99-999")
+        first["value"] = 0
+        second = contract_extractor.structure_contract("Contract text")
+
+        assert second["value"] == 250000.00
+        assert "99-999" not in second["approved_cost_codes"]
+
+    def test_use_cache_false_bypasses_cache(self, contract_extractor, valid_contract_data):
+        """use_cache=False neither reads nor fills the cache."""
+        contract_extractor.llm_client.extract_json.return_value = valid_contract_data
+
+        contract_extractor.structure_contract("Contract text")
+        contract_extractor.structure_contract("Contract text", use_cache=False)
+
+        assert contract_extractor.llm_client.extract_json.call_count == 2
+
+
 class TestValidateExtractedContract:
     """Test contract data validation."""
 
@@ -0,0 +1,98 @@
+"""
+Unit tests for CypherQueryTool query generation caching.
+
+Tests:
+- Identical prompts reuse cached Cypher instead of calling the LLM
+- Different actions or models miss the cache
+- cypher_cache_enabled=False always calls the LLM
+- Failed generations and queries that fail to execute are not cached
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from backend.agents.tools.cypher_query_tool import CypherQueryTool
+from backend.core.config import settings
+
+
+@pytest.fixture
+def tool(monkeypatch):
+    """CypherQueryTool with mocked Neo4j and Anthropic clients, cache enabled."""
+    monkeypatch.setattr(settings, "cypher_cache_enabled", True)
+    with patch("backend.agents.tools.cypher_query_tool.Neo4jClient"), patch(
+        "backend.agents.tools.cypher_query_tool.AnthropicClient"
+    ):
+        tool = CypherQueryTool()
+    tool.neo4j_client = Mock()
+    tool.neo4j_client.run_query.return_value = [{"i": {"invoice_number": "INV-1"}}]
+    tool.llm = Mock()
+    tool.llm.model = "test-model"
+    tool.llm.extract_json.return_value = {
+        "query": "MATCH (i:Invoice) RETURN i LIMIT 10"
+    }
+    return tool
+
+
+class TestCypherCache:
+    """Test the TTL cache around Cypher generation."""
+
+    def test_cache_hit(self, tool):
+        first = tool.run(query="Show invoices", action="Find invoices")
+        second = tool.run(query="Show invoices", action="Find invoices")
+
+        assert first["status"] == second["status"] == "success"
+        assert first["cypher_query"] == second["cypher_query"]
+        assert tool.llm.extract_json.call_count == 1
+        assert tool.neo4j_client.run_query.call_count == 2
+
+    def test_cache_miss_on_different_action(self, tool):
+        tool.run(query="Show invoices", action="Find invoices")
+        tool.run(query="Show contracts", action="Find contracts")
+
+        assert tool.llm.extract_json.call_count == 2
+
+    def test_cache_miss_on_different_model(self, tool):
+        tool.run(query="Show invoices", action="Find invoices")
+        tool.llm.model = "other-model"
+        tool.run(query="Show invoices", action="Find invoices")
+
+        assert tool.llm.extract_json.call_count == 2
+
+    def test_cache_disabled(self, tool, monkeypatch):
+        monkeypatch.setattr(settings, "cypher_cache_enabled", False)
+
+        tool.run(query="Show invoices", action="Find invoices")
+        tool.run(query="Show invoices", action="Find invoices")
+
+        assert tool.llm.extract_json.call_count == 2
+
+    def test_failed_generation_not_cached(self, tool):
+        tool.llm.extract_json.side_effect = [
+            Exception("LLM error"),
+            {"query": "MATCH (c:Contract) RETURN c"},
+        ]
+
+        assert tool.run(query="Show contracts", action="Find contracts")["status"] == "failed"
+        assert tool.run(query="Show contracts", action="Find contracts")["status"] == "success"
+        assert tool.llm.extract_json.call_count == 2
+
+    def test_execution_failure_not_cached(self, tool):
+        """A query that fails to run is regenerated for the next identical prompt."""
+        tool.neo4j_client.run_query.side_effect = [Exception("SyntaxError"), []]
+
+        first = tool.run(query="Show invoices", action="Find invoices")
+        second = tool.run(query="Show invoices", action="Find invoices")
+
+        assert first["status"] == "failed"
+        assert second["status"] == "success"
+        assert tool.llm.extract_json.call_count == 2
+
+    def test_execution_failure_evicts_cached_query(self, tool):
+        """A cached query that later fails to run is dropped from the cache."""
+        tool.neo4j_client.run_query.side_effect = [[], Exception("SyntaxError"), []]
+
+        tool.run(query="Show invoices", action="Find invoices")
+        assert tool.run(query="Show invoices", action="Find invoices")["status"] == "failed"
+        tool.run(query="Show invoices", action="Find invoices")
+
+        assert tool.llm.extract_json.call_count == 2
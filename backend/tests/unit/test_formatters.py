@@ -0,0 +1,41 @@
+"""
+Unit tests for frontend display formatters.
+
+Tests:
+- format_datetime_series matches the scalar format_datetime per value
+- Mixed UTC offsets and naive/aware mixes fall back instead of raising
+"""
+
+import pandas as pd
+import pytest
+
+from frontend.utils.formatters import format_datetime, format_datetime_series
+
+
+class TestFormatDatetimeSeries:
+    """Test vectorised timestamp formatting."""
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            ["2024-01-01T10:00:00", "2024-01-02T11:30:00.123456"],
+            ["2024-01-01T10:00:00+02:00", "2024-01-02T11:30:00+02:00"],
+            ["2024-01-01T10:00:00+00:00", "2024-01-01T10:00:00+02:00"],
+            ["2024-01-01T10:00:00", "2024-01-01T10:00:00Z"],
+            ["2024-01-01T10:00:00", "N/A"],
+        ],
+        ids=["naive", "same-offset", "mixed-offsets", "naive-and-utc", "unparseable"],
+    )
+    def test_matches_scalar_formatter(self, values):
+        """Each value keeps its own wall-clock time, like format_datetime."""
+        result = format_datetime_series(pd.Series(values))
+
+        assert list(result) == [format_datetime(v) for v in values]
+
+    def test_mixed_offsets_keep_wall_clock(self):
+        """Offsets are not converted to UTC before formatting."""
+        result = format_datetime_series(
+            pd.Series(["2024-01-01T10:00:00+00:00", "2024-01-01T10:00:00+02:00"])
+        )
+
+        assert list(result) == ["2024-01-01 10:00:00", "2024-01-01 10:00:00"]
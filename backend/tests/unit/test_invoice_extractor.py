@@ -0,0 +1,117 @@
+"""
+Unit tests for Invoice Extractor structuring.
+
+Tests:
+- structure_invoice cache hit/miss and copy isolation
+- structure_invoice_node bypassing the cache on critic retries
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from backend.ingestion.extractor import InvoiceExtractor
+from backend.ingestion.pipeline.nodes import structure_invoice_node
+
+
+@pytest.fixture
+def invoice_extractor():
+    """Create InvoiceExtractor with mocked GroqClient."""
+    with patch("backend.ingestion.extractor.GroqClient") as mock_groq_cls:
+        mock_groq = Mock()
+        mock_groq_cls.return_value = mock_groq
+        extractor = InvoiceExtractor()
+        extractor.llm_client = mock_groq
+        yield extractor
+
+
+@pytest.fixture
+def invoice_data():
+    """Structured invoice as returned by the LLM."""
+    return {
+        "invoice_number": "INV-2024-0001",
+        "date": "2024-01-15",
+        "due_date": None,
+        "contractor_name": "Schultz LLC",
+        "project_name": "South Alyssa Tower",
+        "contract_id": None,
+        "line_items": [
+            {
+                "cost_code": "05-500",
+                "description": "Structural Steel",
+                "quantity": 10.0,
+                "unit_price": 100.0,
+                "total": 1000.0,
+            }
+        ],
+        "total_amount": 1000.0,
+    }
+
+
+class TestStructureInvoiceCache:
+    """Test the structured-output cache around structure_invoice."""
+
+    def test_same_text_hits_cache(self, invoice_extractor, invoice_data):
+        """Identical text is structured by the LLM only once."""
+        invoice_extractor.llm_client.extract_json.return_value = invoice_data
+
+        first = invoice_extractor.structure_invoice("Invoice text")
+        second = invoice_extractor.structure_invoice("Invoice text")
+
+        assert first == second == invoice_data
+        invoice_extractor.llm_client.extract_json.assert_called_once()
+
+    def test_different_text_misses_cache(self, invoice_extractor, invoice_data):
+        """Different text goes back to the LLM."""
+        invoice_extractor.llm_client.extract_json.return_value = invoice_data
+
+        invoice_extractor.structure_invoice("Invoice text A")
+        invoice_extractor.structure_invoice("Invoice text B")
+
+        assert invoice_extractor.llm_client.extract_json.call_count == 2
+
+    def test_cached_result_is_isolated(self, invoice_extractor, invoice_data):
+        """Mutating a returned result never changes what the cache serves."""
+        invoice_extractor.llm_client.extract_json.return_value = invoice_data
+
+        first = invoice_extractor.structure_invoice("Invoice text")
+        first["line_items"][0]["total"] = 0
+        first["total_amount"] = 0
+        second = invoice_extractor.structure_invoice("Invoice text")
+
+        assert second["total_amount"] == 1000.0
+        assert second["line_items"][0]["total"] == 1000.0
+
+
+class TestStructureInvoiceNodeRetry:
+    """Critic retries must reach the LLM even with repeated feedback."""
+
+    def _run(self, state, invoice_data):
+        with patch("backend.ingestion.extractor.GroqClient") as mock_groq_cls:
+            mock_groq_cls.return_value.extract_json.return_value = invoice_data
+            result = structure_invoice_node(state)
+            return result, mock_groq_cls.return_value.extract_json
+
+    def test_first_attempt_uses_cache(self, invoice_data):
+        """Without feedback, a repeated upload is served from the cache."""
+        state = {"document_id": "doc-1", "raw_text": "Invoice text"}
+
+        self._run(state, invoice_data)
+        result, extract_json = self._run(state, invoice_data)
+
+        assert result["extracted_data"] == invoice_data
+        extract_json.assert_not_called()
+
+    def test_retry_with_same_feedback_skips_cache(self, invoice_data):
+        """The same text and feedback twice still calls the LLM each time."""
+        state = {
+            "document_id": "doc-1",
+            "raw_text": "Invoice text",
+            "critic_feedback": "Line totals do not match quantity x unit price",
+            "retry_count": 1,
+        }
+
+        self._run(state, invoice_data)
+        result, extract_json = self._run(state, invoice_data)
+
+        assert result["extracted_data"] == invoice_data
+        extract_json.assert_called_once()
@@ -0,0 +1,281 @@
+"""
+Unit tests for workflow listing and summary queries.
+
+Tests:
+- WorkflowStore.count_by_status SQL and row mapping
+- WorkflowManager.get_workflow_summary aggregation, including an empty table
+- GET /workflows/summary endpoint
+- min_severity filtering of the quarantined listing
+- list_workflows status filter and LIMIT/OFFSET paging
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+from unittest.mock import MagicMock, patch
+
+from backend.api.routers import workflows as workflows_router
+from backend.services.workflow_manager import WorkflowManager
+from backend.storage.workflow_store import WorkflowStore
+
+
+@pytest.fixture
+def conn():
+    """Mocked Postgres connection handed out by the pool."""
+    conn = MagicMock()
+    pool = MagicMock()
+    pool.connection.return_value.__enter__.return_value = conn
+    with patch("backend.storage.workflow_store.get_pool", return_value=pool):
+        yield conn
+
+
+@pytest.fixture
+def manager():
+    """WorkflowManager backed by a real WorkflowStore, without compiling the graph."""
+    manager = WorkflowManager.__new__(WorkflowManager)
+    manager.store = WorkflowStore()
+    return manager
+
+
+class TestCountByStatus:
+    """Test per-status counts aggregated in SQL."""
+
+    def test_counts_per_status(self, conn):
+        """Each status row maps to its total and paused counts."""
+        conn.execute.return_value.fetchall.return_value = [
+            {"status": "completed", "total": 4, "paused": 0},
+            {"status": "quarantined", "total": 2, "paused": 2},
+        ]
+
+        rows = WorkflowStore().count_by_status()
+
+        assert rows == [
+            {"status": "completed", "total": 4, "paused": 0},
+            {"status": "quarantined", "total": 2, "paused": 2},
+        ]
+        sql, params = conn.execute.call_args.args
+        assert "GROUP BY status" in sql
+        assert "COUNT(*) FILTER (WHERE paused)" in sql
+        assert "user_id" not in sql
+        assert params == ()
+
+    def test_scoped_to_user(self, conn):
+        """A user_id adds an owner filter."""
+        conn.execute.return_value.fetchall.return_value = []
+
+        WorkflowStore().count_by_status(user_id="user-1")
+
+        sql, params = conn.execute.call_args.args
+        assert "WHERE user_id = %s" in sql
+        assert params == ("user-1",)
+
+
+class TestWorkflowSummary:
+    """Test the manager's summary built from per-status counts."""
+
+    def test_summary_counts(self, conn, manager):
+        """Totals add up across statuses; quarantined counts paused workflows."""
+        conn.execute.return_value.fetchall.return_value = [
+            {"status": "completed", "total": 5, "paused": 0},
+            {"status": "processing", "total": 2, "paused": 0},
+            {"status": "failed", "total": 1, "paused": 0},
+            {"status": "quarantined", "total": 3, "paused": 3},
+            {"status": "pending_review", "total": 1, "paused": 1},
+        ]
+
+        summary = manager.get_workflow_summary(user_id="user-1")
+
+        assert summary == {
+            "total": 12,
+            "completed": 5,
+            "processing": 2,
+            "failed": 1,
+            "quarantined": 4,
+        }
+
+    def test_empty_table(self, conn, manager):
+        """No workflows yields all-zero counts, not missing keys."""
+        conn.execute.return_value.fetchall.return_value = []
+
+        summary = manager.get_workflow_summary()
+
+        assert summary == {
+            "total": 0,
+            "completed": 0,
+            "processing": 0,
+            "failed": 0,
+            "quarantined": 0,
+        }
+
+
+class TestSummaryEndpoint:
+    """Test GET /workflows/summary."""
+
+    def test_returns_summary_for_current_user(self):
+        """The endpoint scopes the summary to the caller and returns it as-is."""
+        mock_manager = MagicMock()
+        mock_manager.get_workflow_summary.return_value = {
+            "total": 3,
+            "completed": 1,
+            "processing": 1,
+            "failed": 0,
+            "quarantined": 1,
+        }
+        with patch.object(
+            workflows_router, "get_workflow_manager", return_value=mock_manager
+        ):
+            response = asyncio.run(
+                workflows_router.get_workflow_summary(current_user={"id": "user-1"})
+            )
+
+        mock_manager.get_workflow_summary.assert_called_once_with(user_id="user-1")
+        assert response.total == 3
+        assert response.quarantined == 1
+
+
+class TestQuarantinedSeverityFilter:
+    """Test min_severity on GET /workflows/quarantined and its store query."""
+
+    def _request(self, min_severity):
+        mock_manager = MagicMock()
+        mock_manager.get_quarantined_workflows.return_value = []
+        with patch.object(
+            workflows_router, "get_workflow_manager", return_value=mock_manager
+        ):
+            asyncio.run(
+                workflows_router.get_quarantined_workflows(
+                    min_severity=min_severity, current_user={"id": "user-1"}
+                )
+            )
+        return mock_manager.get_quarantined_workflows.call_args.kwargs
+
+    @pytest.mark.parametrize(
+        "min_severity, expected",
+        [
+            ("low", ["low", "medium", "high", "critical"]),
+            ("medium", ["medium", "high", "critical"]),
+            ("high", ["high", "critical"]),
+            ("critical", ["critical"]),
+            ("HIGH", ["high", "critical"]),
+        ],
+    )
+    def test_threshold_includes_higher_levels(self, min_severity, expected):
+        """A threshold expands to itself and every more severe level."""
+        kwargs = self._request(min_severity)
+
+        assert kwargs == {"user_id": "user-1", "risk_levels": expected}
+
+    def test_none_means_no_filter(self):
+        """Without min_severity every quarantined workflow is returned."""
+        kwargs = self._request(None)
+
+        assert kwargs == {"user_id": "user-1", "risk_levels": None}
+
+    def test_unknown_severity_rejected(self):
+        """An unknown level is a 400, not an empty or unfiltered list."""
+        with pytest.raises(HTTPException) as exc_info:
+            self._request("severe")
+
+        assert exc_info.value.status_code == 400
+        assert "min_severity" in exc_info.value.detail
+
+    def test_store_filters_by_risk_levels(self, conn):
+        """risk_levels become one ANY(...) clause alongside paused and owner."""
+        conn.execute.return_value.fetchall.return_value = []
+
+        WorkflowStore().get_all_quarantined(
+            user_id="user-1", risk_levels=["high", "critical"]
+        )
+
+        sql, params = conn.execute.call_args.args
+        assert "paused = TRUE AND user_id = %s AND risk_level = ANY(%s)" in sql
+        assert params == ["user-1", ["high", "critical"]]
+
+    def test_store_without_risk_levels(self, conn):
+        """No risk_levels leaves the risk filter out of the query."""
+        conn.execute.return_value.fetchall.return_value = []
+
+        WorkflowStore().get_all_quarantined(user_id="user-1")
+
+        sql, params = conn.execute.call_args.args
+        assert "risk_level" not in sql
+        assert params == ["user-1"]
+
+
+def _workflow_row(document_id: str, status: str = "completed") -> dict:
+    return {
+        "document_id": document_id,
+        "user_id": "user-1",
+        "status": status,
+        "paused": False,
+        "risk_level": None,
+        "retry_count": 0,
+        "state_json": json.dumps({"document_id": document_id}),
+        "created_at": "2025-01-01T00:00:00",
+        "updated_at": "2025-01-01T00:00:00",
+    }
+
+
+class TestListWorkflows:
+    """Test paged, optionally status-filtered workflow listing."""
+
+    def test_default_page(self, conn):
+        """No filters: newest first with the default LIMIT/OFFSET."""
+        conn.execute.return_value.fetchall.return_value = [_workflow_row("doc-1")]
+
+        workflows = WorkflowStore().list_workflows()
+
+        sql, params = conn.execute.call_args.args
+        assert "WHERE" not in sql
+        assert sql.endswith("ORDER BY created_at DESC LIMIT %s OFFSET %s")
+        assert params == [100, 0]
+        assert workflows[0]["document_id"] == "doc-1"
+        assert workflows[0]["state"] == {"document_id": "doc-1"}
+
+    def test_status_and_owner_filters(self, conn):
+        """Status and owner become WHERE clauses ahead of the paging params."""
+        conn.execute.return_value.fetchall.return_value = []
+
+        WorkflowStore().list_workflows(
+            status="failed", user_id="user-1", limit=20, offset=40
+        )
+
+        sql, params = conn.execute.call_args.args
+        assert "WHERE status = %s AND user_id = %s ORDER BY" in sql
+        assert params == ["failed", "user-1", 20, 40]
+
+    def test_manager_passes_paging_through(self, conn, manager):
+        """The manager forwards status, owner, limit and offset to the store."""
+        conn.execute.return_value.fetchall.return_value = [
+            _workflow_row("doc-2", status="quarantined")
+        ]
+
+        workflows = manager.list_workflows(
+            status="quarantined", limit=1, user_id="user-1", offset=1
+        )
+
+        _, params = conn.execute.call_args.args
+        assert params == ["quarantined", "user-1", 1, 1]
+        assert [w["document_id"] for w in workflows] == ["doc-2"]
+
+    def test_endpoint_scopes_to_current_user(self):
+        """GET /workflows forwards its query params with the caller's id."""
+        mock_manager = MagicMock()
+        mock_manager.list_workflows.return_value = []
+        with patch.object(
+            workflows_router, "get_workflow_manager", return_value=mock_manager
+        ):
+            asyncio.run(
+                workflows_router.list_workflows(
+                    status="completed",
+                    limit=10,
+                    offset=30,
+                    current_user={"id": "user-1"},
+                )
+            )
+
+        mock_manager.list_workflows.assert_called_once_with(
+            status="completed", limit=10, user_id="user-1", offset=30
+        )
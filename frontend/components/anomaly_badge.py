@@ -5,7 +5,8 @@ Display anomaly information with severity-based styling.
 """
 
 import streamlit as st
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
 import sys
 from pathlib import Path
 
@@ -20,13 +21,18 @@ from formatters import (
 )
 
 
-def render_anomaly_badge(anomaly: Dict[str, Any], compact: bool = False):
+def render_anomaly_badge_html(anomaly: Dict[str, Any], compact: bool = False) -> str:
     """
-    Render an anomaly badge with severity color.
+    Build the HTML fragment for an anomaly badge without rendering it.
+
+    Lets callers join several badges into one st.markdown call.
 
     Args:
         anomaly: Anomaly data dictionary with 'type', 'severity', 'message'
-        compact: Whether to show compact version
+        compact: Whether to build the compact version
+
+    Returns:
+        HTML string for the badge
     """
     anomaly_type = anomaly.get("type", "unknown")
     severity = anomaly.get("severity", "medium")
@@ -39,26 +45,49 @@ def render_anomaly_badge(anomaly: Dict[str, Any], compact: bool = False):
 
     if compact:
         # Compact badge (just icon and type)
-        st.markdown(
+        return (
             f'<span style="background-color: {color}; color: black; '
             f'padding: 0.2rem 0.5rem; border-radius: 0.3rem; '
             f'font-size: 0.9rem; font-weight: 500;">'
-            f'{icon} {formatted_type}</span>',
-            unsafe_allow_html=True,
-        )
-    else:
-        # Full badge with message
-        st.markdown(
-            f'<div style="background-color: {color}; '
-            f'padding: 0.75rem; border-radius: 0.5rem; '
-            f'margin: 0.5rem 0; border-left: 4px solid {color};">'
-            f'<strong>{icon} {formatted_type}</strong> '
-            f'<span style="color: #333; margin-left: 0.5rem;">({severity.upper()})</span><br>'
-            f'<span style="color: #555;">{message}</span>'
-            f"</div>",
-            unsafe_allow_html=True,
+            f'{icon} {formatted_type}</span>'
         )
 
+    # Full badge with message
+    return (
+        f'<div style="background-color: {color}; '
+        f'padding: 0.75rem; border-radius: 0.5rem; '
+        f'margin: 0.5rem 0; border-left: 4px solid {color};">'
+        f'<strong>{icon} {formatted_type}</strong> '
+        f'<span style="color: #333; margin-left: 0.5rem;">({severity.upper()})</span><br>'
+        f'<span style="color: #555;">{message}</span>'
+        f"</div>"
+    )
+
+
+def render_anomaly_badge(anomaly: Dict[str, Any], compact: bool = False):
+    """
+    Render an anomaly badge with severity color.
+
+    Args:
+        anomaly: Anomaly data dictionary with 'type', 'severity', 'message'
+        compact: Whether to show compact version
+    """
+    st.markdown(render_anomaly_badge_html(anomaly, compact), unsafe_allow_html=True)
+
+
+def render_anomaly_badges(anomalies: List[Dict[str, Any]], compact: bool = False):
+    """
+    Render several anomaly badges as a single markdown element.
+
+    Args:
+        anomalies: List of anomaly dictionaries
+        compact: Whether to show compact versions
+    """
+    st.markdown(
+        "".join(render_anomaly_badge_html(a, compact) for a in anomalies),
+        unsafe_allow_html=True,
+    )
+
 
 def render_anomaly_list(anomalies: List[Dict[str, Any]], title: str = "Anomalies"):
     """
@@ -75,8 +104,7 @@ def render_anomaly_list(anomalies: List[Dict[str, Any]], title: str = "Anomalies
     st.markdown(f"### {title}")
     st.markdown(f"Found **{len(anomalies)}** anomalies:")
 
-    for anomaly in anomalies:
-        render_anomaly_badge(anomaly, compact=False)
+    render_anomaly_badges(anomalies, compact=False)
 
 
 def render_anomaly_summary(anomalies: List[Dict[str, Any]]):
@@ -129,10 +157,15 @@ def get_severity_level(anomalies: List[Dict[str, Any]]) -> str:
     if not anomalies:
         return "none"
 
-    severity_order = ["critical", "high", "medium", "low"]
+    return _highest_severity(tuple(a.get("severity", "") for a in anomalies))
+
 
-    for severity in severity_order:
-        if any(a.get("severity", "").lower() == severity for a in anomalies):
+@lru_cache(maxsize=512)
+def _highest_severity(severities: Tuple[str, ...]) -> str:
+    """Memoized core of get_severity_level, keyed by the anomalies' severities."""
+    present = {s.lower() for s in severities}
+    for severity in ("critical", "high", "medium", "low"):
+        if severity in present:
             return severity
 
     return "low"
@@ -99,13 +99,13 @@ def render_workflow_progress(workflow: Dict[str, Any]):
     elif status.lower() == "failed":
         progress = 0
     elif current_node in stages:
-        progress = ((stages.index(current_node) + 1) / len(stages)) * 100
+        progress = (stages.index(current_node) + 1) * 100 // len(stages)
     else:
         progress = 10
 
-    # Display progress bar
-    st.progress(progress / 100)
-    st.caption(f"Progress: {progress:.0f}% - Current: {current_node}")
+    # Display progress bar (st.progress takes an int percentage directly)
+    st.progress(progress)
+    st.caption(f"Progress: {progress}% - Current: {current_node}")
 
 
 def render_workflow_actions(workflow_id: str):
@@ -9,20 +9,26 @@ import sys
 import time
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 import plotly.graph_objects as go
 import streamlit as st
 
 frontend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(frontend_path))
 
-from utils.api_client import APIClient
-from utils.formatters import format_currency
+from utils.api_client import APIClient, get_api_client, require_live
+from utils.formatters import format_currency, format_currency_series
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 _CACHE_TTL = 60  # seconds
+_MAX_BARS = 150  # beyond this, the variance chart is trimmed or drawn with WebGL
+_MONEY_COLUMN = st.column_config.NumberColumn(format="dollar")
+_PCT_COLUMN = st.column_config.NumberColumn(format="%.1f%%")
 
 
 def _load_dashboard(api: APIClient) -> dict:
@@ -32,7 +38,8 @@ def _load_dashboard(api: APIClient) -> dict:
     cached_data = st.session_state.get("_analytics_data")
     if cached_data is not None and (now - cached_at) < _CACHE_TTL:
         return cached_data
-    data = api.get_analytics_dashboard()
+    # Raise on outage stand-ins so an empty result is never cached as real data
+    data = require_live(api.get_analytics_dashboard())
     st.session_state["_analytics_data"] = data
     st.session_state["_analytics_cached_at"] = now
     return data
@@ -41,8 +48,7 @@ def _load_dashboard(api: APIClient) -> dict:
 st.title("Analytics Dashboard")
 st.markdown("Budget variance, contractor spend, and invoice aging — scoped to your data.")
 
-api = APIClient()
-api.token = st.session_state.get("token")
+api = get_api_client()
 
 if st.button("Refresh"):
     st.session_state.pop("_analytics_data", None)
@@ -77,54 +83,95 @@ st.divider()
 st.subheader("Budget Variance by Project")
 
 if budget_summary:
-    projects = [b["project_name"] for b in budget_summary]
-    allocated = [b["total_allocated"] for b in budget_summary]
-    spent = [b["total_spent"] for b in budget_summary]
-    variance_pcts = [b["variance_pct"] for b in budget_summary]
+    # One frame for the chart and the table; status and colours are derived
+    # column-wise instead of per-row in Python
+    df = pd.DataFrame(
+        budget_summary,
+        columns=[
+            "project_name",
+            "total_allocated",
+            "total_spent",
+            "variance_amount",
+            "variance_pct",
+        ],
+    ).rename(
+        columns={
+            "project_name": "Project",
+            "total_allocated": "Allocated",
+            "total_spent": "Spent",
+            "variance_amount": "Variance $",
+            "variance_pct": "Variance %",
+        }
+    )
+    over_budget = df["Variance %"].to_numpy() > 0
+    df["Status"] = np.where(over_budget, "🔴 Over", "🟢 Under")
+
+    # Large portfolios: chart only the biggest variances as bars, or every
+    # project as WebGL markers when the user asks for all of them
+    chart_df = df
+    show_all = False
+    if len(df) > _MAX_BARS:
+        show_all = st.toggle(f"Show all {len(df)} projects", key="variance_show_all")
+        if not show_all:
+            chart_df = df.loc[df["Variance %"].abs().nlargest(_MAX_BARS).index]
+            st.caption(
+                f"Showing the {_MAX_BARS} projects with the largest variance "
+                f"out of {len(df)}."
+            )
 
     # Colour spent bars: red = over budget, green = under
-    spent_colors = ["#DC143C" if v > 0 else "#50C878" for v in variance_pcts]
+    spent_colors = np.where(
+        chart_df["Variance %"].to_numpy() > 0, "#DC143C", "#50C878"
+    )
+
+    # Plain float64 arrays let Plotly ship the values base64-encoded rather
+    # than as per-element JSON
+    projects = chart_df["Project"].tolist()
+    allocated = chart_df["Allocated"].to_numpy(dtype=np.float64)
+    spent = chart_df["Spent"].to_numpy(dtype=np.float64)
 
     fig = go.Figure()
-    fig.add_trace(go.Bar(name="Allocated", x=projects, y=allocated, marker_color="#4A90E2"))
-    fig.add_trace(go.Bar(name="Spent", x=projects, y=spent, marker_color=spent_colors))
+    if show_all:
+        fig.add_trace(
+            go.Scattergl(
+                name="Allocated",
+                x=projects,
+                y=allocated,
+                mode="markers",
+                marker_color="#4A90E2",
+            )
+        )
+        fig.add_trace(
+            go.Scattergl(
+                name="Spent",
+                x=projects,
+                y=spent,
+                mode="markers",
+                marker_color=spent_colors,
+            )
+        )
+    else:
+        fig.add_trace(go.Bar(name="Allocated", x=projects, y=allocated, marker_color="#4A90E2"))
+        fig.add_trace(go.Bar(name="Spent", x=projects, y=spent, marker_color=spent_colors))
     fig.update_layout(
         barmode="group",
         xaxis_title="Project",
         yaxis_title="Amount ($)",
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
         margin=dict(t=30),
+        uirevision="budget_variance",  # keep zoom/pan across reruns
     )
     st.plotly_chart(fig, use_container_width=True)
 
-    # Variance summary table
-    import pandas as pd
-
-    df = pd.DataFrame(
-        [
-            {
-                "Project": b["project_name"],
-                "Allocated": b["total_allocated"],
-                "Spent": b["total_spent"],
-                "Variance $": b["variance_amount"],
-                "Variance %": b["variance_pct"],
-                "Status": "Over" if b["variance_pct"] > 0 else "Under",
-            }
-            for b in budget_summary
-        ]
-    )
+    # Variance summary table (formatted client-side; no per-cell Styler HTML)
     st.dataframe(
-        df.style.format(
-            {
-                "Allocated": "${:,.0f}",
-                "Spent": "${:,.0f}",
-                "Variance $": "${:,.0f}",
-                "Variance %": "{:.1f}%",
-            }
-        ).map(
-            lambda v: "color: #DC143C" if v == "Over" else "color: #50C878",
-            subset=["Status"],
-        ),
+        df,
+        column_config={
+            "Allocated": _MONEY_COLUMN,
+            "Spent": _MONEY_COLUMN,
+            "Variance $": _MONEY_COLUMN,
+            "Variance %": _PCT_COLUMN,
+        },
         use_container_width=True,
         hide_index=True,
     )
@@ -134,16 +181,16 @@ if budget_summary:
         if not b["lines"]:
             continue
         with st.expander(f"{b['project_name']} — cost code breakdown"):
-            line_df = pd.DataFrame(b["lines"])
+            # Arrow table straight from the records: st.dataframe consumes it
+            # natively, with no pandas index or dtype inference
             st.dataframe(
-                line_df.style.format(
-                    {
-                        "allocated": "${:,.0f}",
-                        "spent": "${:,.0f}",
-                        "variance_amount": "${:,.0f}",
-                        "variance_pct": "{:.1f}%",
-                    }
-                ),
+                pa.Table.from_pylist(b["lines"]),
+                column_config={
+                    "allocated": _MONEY_COLUMN,
+                    "spent": _MONEY_COLUMN,
+                    "variance_amount": _MONEY_COLUMN,
+                    "variance_pct": _PCT_COLUMN,
+                },
                 use_container_width=True,
                 hide_index=True,
             )
@@ -157,7 +204,11 @@ st.subheader("Contractor Spend")
 
 if contractor_spend:
     names = [r["contractor"] for r in contractor_spend]
-    totals = [r["total_spend"] for r in contractor_spend]
+    totals = np.fromiter(
+        (r["total_spend"] for r in contractor_spend),
+        dtype=np.float64,
+        count=len(contractor_spend),
+    )
     counts = [r["invoice_count"] for r in contractor_spend]
 
     fig = go.Figure(
@@ -166,7 +217,8 @@ if contractor_spend:
             y=names,
             orientation="h",
             marker_color="#4A90E2",
-            text=[f"{format_currency(t)} ({c} inv.)" for t, c in zip(totals, counts)],
+            text=format_currency_series(pd.Series(totals))
+            + pd.Series(counts).map(" ({} inv.)".format),
             textposition="outside",
         )
     )
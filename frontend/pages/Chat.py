@@ -8,14 +8,12 @@ that opens when the app starts.
 import streamlit as st
 import sys
 from pathlib import Path
-import pandas as pd
-import plotly.express as px
 from datetime import datetime
 
 frontend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(frontend_path))
 
-from utils.api_client import APIClient
+from utils.api_client import APIClient, get_api_client
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,11 +22,7 @@ logger = get_logger(__name__)
 if not st.session_state.get("token"):
     st.rerun()
 
-if "api" not in st.session_state:
-    st.session_state.api = APIClient()
-
-api: APIClient = st.session_state.api
-api.token = st.session_state.token
+api: APIClient = get_api_client()
 
 # ── Session state ─────────────────────────────────────────────────────────────
 for key, default in [
@@ -65,11 +59,15 @@ def render_assistant_message(msg: dict):
 
     if display_format == "table" and "rows" in display_data:
         st.markdown("---")
-        st.dataframe(pd.DataFrame(display_data["rows"]), use_container_width=True)
+        # st.dataframe takes the list of row dicts as-is
+        st.dataframe(display_data["rows"], use_container_width=True)
         if "summary" in display_data:
             st.info(f"📊 {display_data['summary']}")
 
     elif display_format == "chart":
+        # Deferred: plotly is only needed once a chart reply is rendered
+        import plotly.express as px
+
         st.markdown("---")
         chart_type = display_data.get("chart_type", "bar")
         if chart_type == "bar":
@@ -210,6 +208,13 @@ if st.session_state.pending_input is not None:
         stage_placeholder = st.empty()
         response_container = st.empty()
         stage_placeholder.markdown(f"_{initial_label}_")
+        shown_stage = [initial_label]
+
+        def _show_stage(label: str):
+            # The ReAct loop repeats stages; only push a frame when the label changes
+            if label != shown_stage[0]:
+                stage_placeholder.markdown(f"_{label}_")
+                shown_stage[0] = label
 
         response_text = ""
         display_format = "text"
@@ -219,6 +224,7 @@ if st.session_state.pending_input is not None:
 
         def _render_response():
             stage_placeholder.empty()
+            shown_stage[0] = None
             with response_container.container():
                 render_assistant_message({
                     "role": "assistant",
@@ -239,24 +245,24 @@ if st.session_state.pending_input is not None:
                 data = event.get("data", {})
 
                 if etype == "planner":
-                    stage_placeholder.markdown(
-                        "_Classifying documents..._"
+                    _show_stage(
+                        "Classifying documents..."
                         if data.get("route") == "upload_plan"
-                        else "_Planning query..._"
+                        else "Planning query..."
                     )
                 elif etype == "upload_agent":
-                    stage_placeholder.markdown("_Saving to graph..._")
+                    _show_stage("Saving to graph...")
                 elif etype == "upload_summary":
                     response_text = data.get("response", response_text)
                     display_format = data.get("display_format", "text")
                     display_data = data.get("display_data")
                     _render_response()
                 elif etype == "executor":
-                    stage_placeholder.markdown("_Querying data..._")
+                    _show_stage("Querying data...")
                 elif etype == "planner_react":
-                    stage_placeholder.markdown("_Planning next step..._")
+                    _show_stage("Planning next step...")
                 elif etype == "validator":
-                    stage_placeholder.markdown("_Reviewing answer..._")
+                    _show_stage("Reviewing answer...")
                 elif etype == "responder":
                     response_text = data.get("response", response_text)
                     if data.get("display_data") is not None:
@@ -316,8 +322,10 @@ response = st.chat_input(
 # New submission from the chat input widget
 if response:
     user_text = response.text or ""
+    # getvalue() hands back the upload buffer without a read-position copy;
+    # the same bytes object is reused for the multipart request
     pending_files = [
-        {"bytes": uf.read(), "name": uf.name} for uf in (response.files or [])
+        {"bytes": uf.getvalue(), "name": uf.name} for uf in (response.files or [])
     ]
 
     if not user_text and not pending_files:
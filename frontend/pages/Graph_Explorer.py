@@ -16,7 +16,7 @@ from typing import List, Dict, Any
 frontend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(frontend_path))
 
-from utils.api_client import APIClient
+from utils.api_client import APIClient, get_api_client, require_live
 from utils.formatters import format_currency, format_date
 from utils.logger import get_logger
 
@@ -32,7 +32,8 @@ def _load_graph_stats(api: APIClient) -> dict:
     cached = st.session_state.get("_graph_stats")
     if cached is not None and (now - cached_at) < _STATS_TTL:
         return cached
-    data = api.get_graph_stats()
+    # Raise on outage stand-ins so an empty result is never cached as real data
+    data = require_live(api.get_graph_stats())
     st.session_state["_graph_stats"] = data
     st.session_state["_graph_stats_cached_at"] = now
     return data
@@ -41,9 +42,8 @@ def _load_graph_stats(api: APIClient) -> dict:
 st.title("🔍 Graph Explorer")
 st.markdown("Visualize relationships in the knowledge graph.")
 
-# Initialize API client
-api = APIClient()
-api.token = st.session_state.get("token")
+# Session-scoped API client (shared connection pool, token kept current)
+api = get_api_client()
 
 
 def format_neo4j_value(value):
@@ -13,16 +13,13 @@ import streamlit as st
 frontend_path = Path(__file__).parent.parent
 sys.path.insert(0, str(frontend_path))
 
-from utils.api_client import APIClient
+from utils.api_client import APIClient, get_api_client
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 # Shared api client (no token yet)
-if "api" not in st.session_state:
-    st.session_state.api = APIClient()
-
-api: APIClient = st.session_state.api
+api: APIClient = get_api_client()
 
 # Already logged in — go straight to chat (triggers app.py to rerun with full nav)
 if st.session_state.get("token"):
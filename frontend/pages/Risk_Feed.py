@@ -4,23 +4,26 @@ Risk Feed Dashboard
 Real-time monitoring of invoice processing and risk alerts.
 """
 
+import pandas as pd
 import streamlit as st
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from datetime import datetime
+from typing import NamedTuple
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-# Add paths
+# Add paths (once per process — Streamlit re-executes this module every rerun)
 frontend_path = Path(__file__).parent.parent
-sys.path.insert(0, str(frontend_path))
+if str(frontend_path) not in sys.path:
+    sys.path.insert(0, str(frontend_path))
 
-from utils.api_client import APIClient
+from utils.api_client import APIClient, get_api_client, require_live
 from utils.formatters import (
-    format_currency,
-    format_datetime,
+    format_datetime_series,
     get_status_emoji,
 )
-from components.anomaly_badge import render_anomaly_badge, get_severity_level
+from components.anomaly_badge import render_anomaly_badges, get_severity_level
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -28,229 +31,277 @@ logger = get_logger(__name__)
 st.title("🚨 Risk Feed")
 st.markdown("Real-time monitoring of invoice processing and anomaly alerts.")
 
-# Initialize API client
-api = APIClient()
-api.token = st.session_state.get("token")
+# Session-scoped API client (shared connection pool, token kept current)
+api = get_api_client()
+
+
+# Workflow lists come straight from the client, which already memoises them
+# per session and token. The overview's stats aren't client-cached, so they
+# get a page memo; the token argument keys it per user, and require_live
+# raises on outage stand-ins so they are never memoised.
+@st.cache_data(ttl=30)
+def _cached_overview(_api: APIClient, token: str | None) -> dict:
+    # Graph stats and workflow counts are independent; fetch them
+    # concurrently so the overview waits for the slower call, not both.
+    # Workers inherit the script context so the client's st.error reports
+    # still reach the page instead of being dropped off-thread.
+    with ThreadPoolExecutor(
+        max_workers=2,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx()),
+    ) as pool:
+        graph_stats = pool.submit(_api.get_graph_stats)
+        summary = pool.submit(_api.get_workflow_summary)
+        return {
+            "graph_stats": require_live(graph_stats.result()),
+            "summary": require_live(summary.result()),
+        }
+
+
+class WorkflowView(NamedTuple):
+    """Flat per-row view of a workflow, extracted once for rendering."""
+
+    id: str
+    status: str
+    created_at: str
+    invoice_num: str
+    vendor: str
+    total: float
+    has_invoice: bool
+    anomalies: list
+    severity: str | None
+
+
+def _view(workflow: dict) -> WorkflowView:
+    """Pull every field the activity row renders out of a workflow list entry."""
+    state = workflow.get("state", {})
+    invoice_data = state.get("extracted_data") or {}
+    anomalies = state.get("anomalies", [])
+    return WorkflowView(
+        id=workflow.get("document_id", "N/A"),
+        status=workflow.get("status", "unknown"),
+        created_at=workflow.get("created_at", "N/A"),
+        invoice_num=invoice_data.get("invoice_number", "N/A"),
+        vendor=invoice_data.get("vendor_name", "N/A"),
+        total=invoice_data.get("total_amount", 0),
+        has_invoice=bool(invoice_data),
+        anomalies=anomalies,
+        severity=get_severity_level(anomalies) if anomalies else None,
+    )
+
+
+def _remember_selection(table_key: str) -> None:
+    """Record the selected workflow's id when the activity table selection changes.
+
+    Streamlit keeps a keyed table's selection as a row index across data
+    changes, so the id is looked up in the rows the user actually saw.
+    """
+    shown = st.session_state.get(f"{table_key}_ids", [])
+    picked = st.session_state[table_key].selection.rows
+    st.session_state[f"{table_key}_selected"] = (
+        shown[picked[0]] if picked and picked[0] < len(shown) else None
+    )
+
 
 # Refresh controls
 col1, col2, col3 = st.columns([1, 1, 4])
 
 with col1:
     if st.button("🔄 Refresh"):
-        st.session_state.pop("_risk_stats", None)
-        st.session_state.pop("_risk_stats_at", None)
         api.clear_cache()
+        _cached_overview.clear(api, api.token)
         st.rerun()
 
 with col2:
     auto_refresh = st.checkbox("Auto-refresh (5s)")
 
-if auto_refresh:
-    import time
-
-    time.sleep(5)
-    st.rerun()
+# Fragments below re-run on a client-side timer instead of blocking the script
+_refresh_every = 5 if auto_refresh else None
 
 st.markdown("---")
 
+
 # Metrics Dashboard
-st.markdown("## 📊 System Overview")
-
-try:
-    # Get graph stats (session-state cache, 60s TTL)
-    _now = time.monotonic()
-    if (
-        st.session_state.get("_risk_stats") is None
-        or (_now - st.session_state.get("_risk_stats_at", 0)) >= 60
-    ):
-        st.session_state["_risk_stats"] = api.get_graph_stats()
-        st.session_state["_risk_stats_at"] = _now
-    graph_stats = st.session_state["_risk_stats"]
-
-    # Get workflow stats
-    all_workflows = api.list_workflows()
-    quarantined_workflows = api.list_quarantined_workflows()
-
-    # Calculate metrics
-    total_invoices = graph_stats.get("invoice_count", 0)
-    total_projects = graph_stats.get("project_count", 0)
-    total_contracts = graph_stats.get("contract_count", 0)
-    total_workflows = len(all_workflows)
-    quarantined_count = len(quarantined_workflows)
-
-    # Count by status
-    completed_count = sum(1 for w in all_workflows if w.get("status") == "completed")
-    failed_count = sum(1 for w in all_workflows if w.get("status") == "failed")
-    processing_count = sum(1 for w in all_workflows if w.get("status") == "processing")
-
-    # Display metrics
-    col1, col2, col3, col4, col5 = st.columns(5)
-
-    with col1:
-        st.metric("Total Invoices", total_invoices)
-
-    with col2:
-        st.metric("Active Projects", total_projects)
-
-    with col3:
-        st.metric("Contracts", total_contracts)
-
-    with col4:
-        st.metric("Workflows", total_workflows)
-
-    with col5:
-        st.metric("In Quarantine", quarantined_count, delta=f"{quarantined_count} pending")
-
-    # Processing metrics
-    st.markdown("---")
-    col1, col2, col3, col4 = st.columns(4)
+@st.fragment(run_every=_refresh_every)
+def _render_overview():
+    """Render the system overview metrics."""
+    st.markdown("## 📊 System Overview")
 
-    with col1:
-        st.metric("✅ Completed", completed_count)
+    # Reserve the metrics slot before fetching so timed refreshes overwrite
+    # the same element in place instead of rebuilding the layout
+    metrics_slot = st.empty()
 
-    with col2:
-        st.metric("⚙️ Processing", processing_count)
+    try:
+        # Graph stats + workflow counts, fetched together and cached jointly
+        overview = _cached_overview(api, api.token)
+        graph_stats = overview["graph_stats"]
+        summary = overview["summary"]
 
-    with col3:
-        st.metric("⚠️ Quarantined", quarantined_count)
+        # Calculate metrics
+        total_invoices = graph_stats.get("invoice_count", 0)
+        total_projects = graph_stats.get("project_count", 0)
+        total_contracts = graph_stats.get("contract_count", 0)
+        total_workflows = summary.get("total", 0)
+        quarantined_count = summary.get("quarantined", 0)
+        completed_count = summary.get("completed", 0)
+        failed_count = summary.get("failed", 0)
+        processing_count = summary.get("processing", 0)
 
-    with col4:
-        st.metric("❌ Failed", failed_count)
+        # Display metrics
+        with metrics_slot.container():
+            col1, col2, col3, col4, col5 = st.columns(5)
 
-except Exception as e:
-    logger.error("risk_metrics_load_failed", error=e)
-    st.error(f"Failed to load metrics: {e}")
+            with col1:
+                st.metric("Total Invoices", total_invoices)
 
-st.markdown("---")
+            with col2:
+                st.metric("Active Projects", total_projects)
 
-# Recent Activity Feed
-st.markdown("## 📋 Recent Activity")
+            with col3:
+                st.metric("Contracts", total_contracts)
 
-try:
-    # Get recent workflows
-    recent_workflows = api.list_workflows()[:20]
+            with col4:
+                st.metric("Workflows", total_workflows)
 
-    if not recent_workflows:
-        st.info("No workflows yet. Upload an invoice to get started!")
-    else:
-        # Filter controls
-        col1, col2 = st.columns([1, 3])
+            with col5:
+                st.metric("In Quarantine", quarantined_count, delta=f"{quarantined_count} pending")
 
-        with col1:
-            status_filter = st.selectbox(
-                "Filter by Status",
-                ["All", "completed", "quarantined", "processing", "failed"],
-            )
+            # Processing metrics
+            st.markdown("---")
+            col1, col2, col3, col4 = st.columns(4)
 
-        # Apply filter
-        if status_filter != "All":
-            filtered_workflows = [
-                w for w in recent_workflows if w.get("status") == status_filter
-            ]
-        else:
-            filtered_workflows = recent_workflows
+            with col1:
+                st.metric("✅ Completed", completed_count)
 
-        st.info(f"Showing {len(filtered_workflows)} workflows")
+            with col2:
+                st.metric("⚙️ Processing", processing_count)
 
-        # Display workflows
-        for workflow in filtered_workflows:
-            workflow_id = workflow.get("document_id", "N/A")
-            status = workflow.get("status", "unknown")
-            created_at = workflow.get("created_at", "N/A")
+            with col3:
+                st.metric("⚠️ Quarantined", quarantined_count)
 
-            # Get full details to show anomalies
-            try:
-                workflow_details = api.get_workflow(workflow_id)
-                state = workflow_details.get("state", {})
-                anomalies = state.get("anomalies", [])
-                invoice_data = state.get("extracted_data", {})  # Fixed: was "invoice"
+            with col4:
+                st.metric("❌ Failed", failed_count)
 
-                with st.container():
-                    # Header row
-                    col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
+    except Exception as e:
+        logger.error("risk_metrics_load_failed", error=e)
+        st.error(f"Failed to load metrics: {e}")
 
-                    with col1:
-                        emoji = get_status_emoji(status)
-                        st.markdown(f"### {emoji} `{workflow_id[:12]}...`")
 
-                    with col2:
-                        st.metric("Status", status.upper())
+_render_overview()
 
-                    with col3:
-                        if created_at != "N/A":
-                            st.caption(format_datetime(created_at))
+st.markdown("---")
 
-                    with col4:
-                        if st.button("Details", key=f"details_{workflow_id}"):
-                            st.session_state[f"expand_{workflow_id}"] = True
 
-                    # Invoice summary
-                    if invoice_data:
-                        invoice_num = invoice_data.get("invoice_number", "N/A")
-                        vendor = invoice_data.get("vendor_name", "N/A")
-                        total = invoice_data.get("total_amount", 0)
+# Recent Activity Feed
+@st.fragment(run_every=_refresh_every)
+def _render_activity():
+    """Render the recent activity feed."""
+    st.markdown("## 📋 Recent Activity")
+
+    try:
+        # Filter controls
+        col1, col2 = st.columns([1, 3])
+
+        with col1:
+            status_filter = st.selectbox(
+                "Filter by Status",
+                ["All", "completed", "quarantined", "processing", "failed"],
+            )
 
-                        st.text(
-                            f"Invoice: {invoice_num} | Vendor: {vendor} | "
-                            f"Amount: {format_currency(total)}"
-                        )
+        # Status filter and page size are applied server-side, before any
+        # detail fetch
+        wanted_status = None if status_filter == "All" else status_filter
+        filtered_workflows = require_live(
+            api.list_workflows(status=wanted_status, limit=20)
+        )
+
+        if not filtered_workflows:
+            if wanted_status is None:
+                st.info("No workflows yet. Upload an invoice to get started!")
+            else:
+                st.info(f"No {wanted_status} workflows")
+        else:
+            rows = [_view(workflow) for workflow in filtered_workflows]
+            st.info(f"Showing {len(rows)} workflows — select a row for anomaly details")
+
+            # Keyed per filter so a selection never carries over to another list
+            table_key = f"activity_table_{status_filter}"
+            st.session_state[f"{table_key}_ids"] = [r.id for r in rows]
+
+            # One table for the whole list instead of columns + widgets per row
+            st.dataframe(
+                {
+                    "Workflow": [
+                        f"{get_status_emoji(r.status)} {r.id[:12]}..." for r in rows
+                    ],
+                    "Status": [r.status.upper() for r in rows],
+                    # Parsed as one column rather than per row
+                    "Created": format_datetime_series(
+                        pd.Series([r.created_at for r in rows])
+                    ).replace("N/A", ""),
+                    "Invoice": [r.invoice_num if r.has_invoice else "" for r in rows],
+                    "Vendor": [r.vendor if r.has_invoice else "" for r in rows],
+                    "Amount": [r.total if r.has_invoice else None for r in rows],
+                    "Anomalies": [len(r.anomalies) for r in rows],
+                    "Severity": [(r.severity or "").upper() for r in rows],
+                },
+                column_config={
+                    "Amount": st.column_config.NumberColumn(format="dollar"),
+                },
+                use_container_width=True,
+                hide_index=True,
+                on_select=partial(_remember_selection, table_key),
+                selection_mode="single-row",
+                key=table_key,
+            )
 
-                    # Anomalies
-                    if anomalies:
-                        severity = get_severity_level(anomalies)
+            # Anomaly details for the selected workflow, matched by id so new
+            # arrivals at the top of the list don't shift it
+            selected_id = st.session_state.get(f"{table_key}_selected")
+            row = next((r for r in rows if r.id == selected_id), None)
+            if row is not None:
+                with st.container(border=True):
+                    st.markdown(f"**{get_status_emoji(row.status)} `{row.id}`**")
+                    if row.anomalies:
+                        count = len(row.anomalies)
 
                         # Color code based on severity
-                        if severity == "critical":
-                            st.error(f"🚨 {len(anomalies)} CRITICAL anomalies detected")
-                        elif severity == "high":
-                            st.warning(f"⚠️ {len(anomalies)} HIGH severity anomalies")
+                        if row.severity == "critical":
+                            st.error(f"🚨 {count} CRITICAL anomalies detected")
+                        elif row.severity == "high":
+                            st.warning(f"⚠️ {count} HIGH severity anomalies")
                         else:
-                            st.info(f"ℹ️ {len(anomalies)} anomalies detected")
-
-                        # Show anomalies in expander
-                        if st.session_state.get(f"expand_{workflow_id}", False):
-                            with st.expander("View Anomalies", expanded=True):
-                                for anomaly in anomalies[:5]:  # Show first 5
-                                    render_anomaly_badge(anomaly, compact=False)
+                            st.info(f"ℹ️ {count} anomalies detected")
 
-                                if len(anomalies) > 5:
-                                    st.caption(f"... and {len(anomalies) - 5} more")
+                        render_anomaly_badges(row.anomalies[:5])  # Show first 5
+                        if count > 5:
+                            st.caption(f"... and {count - 5} more")
                     else:
                         st.success("✅ No anomalies")
 
-                    st.markdown("---")
+    except Exception as e:
+        st.error(f"Failed to load activity feed: {e}")
 
-            except Exception as e:
-                st.error(f"Failed to load workflow {workflow_id}: {e}")
 
-except Exception as e:
-    st.error(f"Failed to load activity feed: {e}")
+_render_activity()
 
 # Sidebar with alerts
 with st.sidebar:
     st.markdown("### 🚨 Active Alerts")
 
     try:
-        # Count high-severity quarantined items
-        quarantined = api.list_quarantined_workflows()
-        high_priority = []
-
-        for workflow in quarantined:
-            try:
-                details = api.get_workflow(workflow.get("document_id"))
-                anomalies = details.get("state", {}).get("anomalies", [])
-                severity = get_severity_level(anomalies)
-
-                if severity in ["critical", "high"]:
-                    high_priority.append(
-                        {
-                            "workflow_id": workflow.get("document_id"),
-                            "severity": severity,
-                            "count": len(anomalies),
-                        }
-                    )
-            except:
-                pass
+        # High-severity filtering happens server-side; the list payload
+        # already carries risk level and anomalies, so no per-item fetch
+        high_priority = [
+            {
+                "workflow_id": workflow.get("document_id"),
+                "severity": workflow.get("risk_level") or "high",
+                "count": len(workflow.get("anomalies", [])),
+            }
+            for workflow in require_live(
+                api.list_quarantined_workflows(min_severity="high")
+            )
+        ]
 
         if high_priority:
             st.error(f"⚠️ {len(high_priority)} high-priority items in quarantine")
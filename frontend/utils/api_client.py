@@ -4,21 +4,267 @@ API Client for Voronode Backend
 Centralized client for all FastAPI endpoints with error handling, caching, and retry logic.
 """
 
+import io
+import json
 import os
+import socket
+import threading
+from concurrent.futures import Future
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Any, Callable
+from functools import wraps
 import streamlit as st
 from pathlib import Path
 import time
 
+try:
+    # Streams multipart bodies in chunks; requests alone builds them in memory
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+try:
+    # Several times faster than stdlib json on graph/analytics payloads; its
+    # JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+# Transient-failure retries run inside urllib3's pool: connect errors for any
+# method, read errors and 429/502/503/504 only for idempotent GETs. Backoff is
+# 0.5s * 2^n with jitter; Retry-After is honoured.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    backoff_jitter=0.5,
+    status_forcelist=[429, 502, 503, 504],
+    allowed_methods=["GET"],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# TCP keepalive so idle pooled sockets between reruns aren't dropped by NATs;
+# TCP_KEEPIDLE/KEEPINTVL are Linux names and skipped where unavailable
+_KEEPALIVE_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10))
+    if hasattr(socket, name)
+]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections enable TCP keepalive probes."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = (
+            HTTPConnection.default_socket_options + _KEEPALIVE_OPTIONS
+        )
+        super().init_poolmanager(*args, **kwargs)
+
+
+@st.cache_resource
+def _http_session() -> requests.Session:
+    """Process-wide HTTP session so keep-alive connections survive reruns."""
+    session = requests.Session()
+    # Every browser session shares this pool, so allow well over requests'
+    # default of 10 connections per host; excess requests open extra
+    # connections rather than blocking
+    adapter = _KeepAliveAdapter(
+        pool_connections=8, pool_maxsize=32, pool_block=False, max_retries=_RETRY
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept"] = "application/json"
+    return session
+
+
+# Circuit breaker: after this many consecutive connection failures or
+# timeouts, calls fail fast for the cooldown instead of each waiting out the
+# request timeout while the backend is down
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN = 30
+
+
+class BackendUnavailable(requests.exceptions.ConnectionError):
+    """Raised without a network call while the circuit breaker is open."""
+
+
+class DegradedList(list):
+    """Empty stand-in a list getter returns while the backend is unavailable."""
+
+
+class DegradedDict(dict):
+    """Empty stand-in a dict getter returns while the backend is unavailable."""
+
+
+def is_degraded(value: Any) -> bool:
+    """True for the stand-ins returned during an outage, not real empty data."""
+    return isinstance(value, (DegradedList, DegradedDict))
+
+
+def require_live(value: Any) -> Any:
+    """Return value, raising BackendUnavailable for an outage stand-in.
+
+    For st.cache_data memos: exceptions are not cached, so an outage neither
+    sticks for the memo's TTL nor renders as an empty result.
+    """
+    if is_degraded(value):
+        raise BackendUnavailable("Backend is unavailable")
+    return value
+
+
+# MIME types for the file kinds the chat uploader accepts, keyed by suffix
+_UPLOAD_MIME = {
+    ".pdf": "application/pdf",
+    ".csv": "text/csv",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".xls": "application/vnd.ms-excel",
+}
+
+
+def _json(response: requests.Response) -> Any:
+    """Decode a response body straight from its bytes."""
+    return _loads(response.content)
+
+
+def _multipart_body(data: dict, files: Optional[List[Dict[str, Any]]]):
+    """Build the chat form body as (data, files, content_type) for requests.
+
+    With requests_toolbelt installed, fields and uploads go into a
+    MultipartEncoder that is read in chunks while the request is sent, instead
+    of requests concatenating every upload into one in-memory body up front.
+    """
+    if not files:
+        return data, None, None
+    parts = [
+        (
+            f["name"],
+            f["bytes"],
+            _UPLOAD_MIME.get(Path(f["name"]).suffix.lower(), "application/octet-stream"),
+        )
+        for f in files
+    ]
+    if MultipartEncoder is not None:
+        body = MultipartEncoder(
+            fields=list(data.items())
+            + [("files", (name, io.BytesIO(raw), mime)) for name, raw, mime in parts]
+        )
+        return body, None, body.content_type
+    return data, [("files", part) for part in parts], None
+
+
+def _cached(ttl: int):
+    """Memoise an APIClient getter per client instance for ttl seconds.
+
+    Parsed JSON is returned as-is from a plain dict, so a hit costs a lookup
+    rather than st.cache_data's argument hashing and result pickling. Callers
+    must treat cached payloads as read-only. The auth token is part of the
+    key, so a client that changes hands never serves one user's data to
+    another.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = (self.token, func.__name__, args, tuple(sorted(kwargs.items())))
+            with self._cache_lock:
+                hit = self._cache.get(key)
+                if hit is not None and hit[0] > time.monotonic():
+                    return hit[1]
+                # Single flight: concurrent misses wait on the first caller's
+                # request instead of each issuing an identical one
+                inflight = self._inflight.get(key)
+                if inflight is None:
+                    future = self._inflight[key] = Future()
+            if inflight is not None:
+                return inflight.result()
+
+            try:
+                value = func(self, *args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(value)
+                with self._cache_lock:
+                    self._cache[key] = (time.monotonic() + ttl, value)
+                return value
+            finally:
+                with self._cache_lock:
+                    self._inflight.pop(key, None)
+
+        return wrapper
+
+    return decorator
+
+
+def _degrade(default: Callable[[], Any]):
+    """Return default() instead of raising while the backend is unavailable.
+
+    default is DegradedList or DegradedDict, so callers can tell the stand-in
+    from a genuinely empty response with is_degraded().
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except BackendUnavailable:
+                return default()
+
+        return wrapper
+
+    return decorator
+
+
+# User-facing message per failure type; looked up along the exception's MRO so
+# ConnectTimeout reads as a connection failure, as it did before
+_ERROR_MESSAGES = {
+    BackendUnavailable: "❌ {error}",
+    requests.exceptions.ConnectionError: "❌ Cannot connect to backend at {base_url}",
+    requests.exceptions.Timeout: "⏱️ Request timed out after {timeout}s",
+    requests.exceptions.HTTPError: "❌ API Error: {status} - {body}",
+    requests.exceptions.RequestException: "❌ Request failed: {error}",
+}
+
+
+def streamlit_error_reporter(message: str, exc: Exception) -> None:
+    """Default APIClient error reporter: show the failure in the Streamlit page."""
+    st.error(message)
+    if isinstance(exc, requests.exceptions.ConnectionError):
+        st.info(
+            "Make sure the FastAPI server is running: `uvicorn backend.main:app --reload`"
+        )
+
 
 class APIClient:
     """Client for interacting with Voronode FastAPI backend."""
 
-    def __init__(self, base_url: str = os.environ.get("BACKEND_URL", "http://localhost:8080")):
+    # Shared by every client, like the connection pool: one outage trips it
+    # for all browser sessions
+    _breaker = {"failures": 0, "opened_at": 0.0}
+    _breaker_lock = threading.Lock()
+
+    def __init__(
+        self,
+        base_url: str = os.environ.get("BACKEND_URL", "http://localhost:8080"),
+        on_error: Callable[[str, Exception], None] = streamlit_error_reporter,
+    ):
         self.base_url = base_url
         self.timeout = 3600
         self.token: str | None = None
+        self._on_error = on_error
+        self._session = _http_session()
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._inflight: dict[tuple, Future] = {}
+        # opened_at of the breaker trip this client last reported
+        self._outage_reported = 0.0
 
     def _auth_headers(self) -> dict:
         if self.token:
@@ -33,48 +279,104 @@ class APIClient:
             existing = kwargs.get("headers", {})
             kwargs["headers"] = {**self._auth_headers(), **existing}
 
+        breaker = APIClient._breaker
+        if breaker["failures"] >= _BREAKER_THRESHOLD:
+            remaining = _BREAKER_COOLDOWN - (time.monotonic() - breaker["opened_at"])
+            if remaining > 0:
+                exc = BackendUnavailable(
+                    f"Backend at {self.base_url} is unavailable; "
+                    f"retrying in {remaining:.0f}s"
+                )
+                # One banner per outage, not one per fast-failed call
+                if self._outage_reported != breaker["opened_at"]:
+                    self._outage_reported = breaker["opened_at"]
+                    self._report(exc)
+                raise exc
+
         try:
-            response = requests.request(method, url, **kwargs)
+            response = self._session.request(method, url, **kwargs)
+            self._record_success()
             response.raise_for_status()
             return response
-        except requests.exceptions.ConnectionError:
-            st.error(f"❌ Cannot connect to backend at {self.base_url}")
-            st.info(
-                "Make sure the FastAPI server is running: `uvicorn backend.main:app --reload`"
-            )
-            raise
-        except requests.exceptions.Timeout:
-            st.error(f"⏱️ Request timed out after {self.timeout}s")
-            raise
-        except requests.exceptions.HTTPError as e:
-            st.error(f"❌ API Error: {e.response.status_code} - {e.response.text}")
+        except requests.exceptions.RequestException as e:
+            if isinstance(
+                e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+            ):
+                self._record_failure()
+            self._report(e)
             raise
 
+    def _report(self, exc: requests.exceptions.RequestException) -> None:
+        """Pass a formatted failure message to the client's error reporter."""
+        template = next(
+            _ERROR_MESSAGES[cls] for cls in type(exc).__mro__ if cls in _ERROR_MESSAGES
+        )
+        response = exc.response
+        self._on_error(
+            template.format(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                status=getattr(response, "status_code", None),
+                body=getattr(response, "text", ""),
+                error=exc,
+            ),
+            exc,
+        )
+
+    @staticmethod
+    def _record_success():
+        """Close the breaker: the backend answered."""
+        with APIClient._breaker_lock:
+            APIClient._breaker["failures"] = 0
+            APIClient._breaker["opened_at"] = 0.0
+
+    @staticmethod
+    def _record_failure():
+        """Count a connection failure; (re)open the breaker once over threshold."""
+        with APIClient._breaker_lock:
+            breaker = APIClient._breaker
+            breaker["failures"] += 1
+            if breaker["failures"] >= _BREAKER_THRESHOLD:
+                breaker["opened_at"] = time.monotonic()
+
     # Health & Status
     def health_check(self) -> Dict[str, Any]:
         """Check API health status."""
         response = self._request("GET", "/api/health")
-        return response.json()
+        return _json(response)
 
     # Workflow Management
-    @st.cache_data(ttl=10)
-    def list_workflows(_self, status: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List all workflows, optionally filtered by status."""
-        params = {"status": status} if status else {}
-        response = _self._request("GET", "/api/workflows", params=params)
-        return response.json()
-
-    @st.cache_data(ttl=10)
-    def get_workflow(_self, workflow_id: str) -> Dict[str, Any]:
+    @_degrade(DegradedList)
+    @_cached(ttl=10)
+    def list_workflows(
+        self,
+        status: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """List workflows newest first, optionally filtered by status and paged."""
+        params = {"limit": limit, "offset": offset}
+        if status:
+            params["status"] = status
+        response = self._request("GET", "/api/workflows", params=params)
+        return _json(response)
+
+    @_degrade(DegradedDict)
+    @_cached(ttl=10)
+    def get_workflow(self, workflow_id: str) -> Dict[str, Any]:
         """Get detailed workflow information."""
-        response = _self._request("GET", f"/api/workflows/{workflow_id}")
-        return response.json()
-
-    @st.cache_data(ttl=10)
-    def list_quarantined_workflows(_self) -> List[Dict[str, Any]]:
-        """Get all workflows in quarantine."""
-        response = _self._request("GET", "/api/workflows/quarantined")
-        return response.json()
+        response = self._request("GET", f"/api/workflows/{workflow_id}")
+        return _json(response)
+
+    @_degrade(DegradedList)
+    @_cached(ttl=10)
+    def list_quarantined_workflows(
+        self, min_severity: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get all workflows in quarantine, optionally at or above a risk level."""
+        params = {"min_severity": min_severity} if min_severity else {}
+        response = self._request("GET", "/api/workflows/quarantined", params=params)
+        return _json(response)
 
     def resume_workflow(
         self,
@@ -95,68 +397,84 @@ class APIClient:
         response = self._request(
             "POST", f"/api/workflows/{workflow_id}/resume", json=payload
         )
-        return response.json()
+        return _json(response)
 
     # Graph Queries
-    @st.cache_data(ttl=300)
-    def query_graph(_self, cypher_query: str) -> Dict[str, Any]:
+    @_degrade(DegradedDict)
+    @_cached(ttl=300)
+    def query_graph(self, cypher_query: str) -> Dict[str, Any]:
         """Execute custom Cypher query on Neo4j."""
-        response = _self._request(
+        response = self._request(
             "POST", "/api/graph/query", json={"query": cypher_query}
         )
-        return response.json()
+        return _json(response)
+
+    @_degrade(DegradedDict)
+    def get_workflow_summary(self) -> Dict[str, int]:
+        """Get workflow counts by status (total, completed, processing, failed, quarantined)."""
+        response = self._request("GET", "/api/workflows/summary")
+        return _json(response)
 
+    @_degrade(DegradedDict)
     def get_graph_stats(self) -> Dict[str, Any]:
         """Get graph database statistics."""
         response = self._request("GET", "/api/graph/stats")
-        return response.json()
+        return _json(response)
 
-    @st.cache_data(ttl=120)
-    def get_project_graph(_self, project_id: str) -> Dict[str, Any]:
+    @_degrade(DegradedDict)
+    @_cached(ttl=120)
+    def get_project_graph(self, project_id: str) -> Dict[str, Any]:
         """Get subgraph for a specific project."""
-        response = _self._request("GET", f"/api/graph/project/{project_id}")
-        return response.json()
+        response = self._request("GET", f"/api/graph/project/{project_id}")
+        return _json(response)
 
     # Analytics
+    @_degrade(DegradedDict)
     def get_analytics_dashboard(self) -> Dict[str, Any]:
         """Get all analytics dashboard data in one request."""
         response = self._request("GET", "/api/analytics/dashboard")
-        return response.json()
+        return _json(response)
 
     # Invoice Data
-    @st.cache_data(ttl=30)
-    def get_invoice(_self, invoice_id: str) -> Dict[str, Any]:
+    @_degrade(DegradedDict)
+    @_cached(ttl=30)
+    def get_invoice(self, invoice_id: str) -> Dict[str, Any]:
         """Get invoice details by ID."""
-        response = _self._request("GET", f"/api/invoices/{invoice_id}")
-        return response.json()
+        response = self._request("GET", f"/api/invoices/{invoice_id}")
+        return _json(response)
 
-    @st.cache_data(ttl=30)
-    def list_invoices(_self, limit: int = 100) -> List[Dict[str, Any]]:
+    @_degrade(DegradedList)
+    @_cached(ttl=30)
+    def list_invoices(self, limit: int = 100) -> List[Dict[str, Any]]:
         """List recent invoices."""
-        response = _self._request("GET", f"/api/invoices?limit={limit}")
-        return response.json()
+        response = self._request("GET", "/api/invoices", params={"limit": limit})
+        return _json(response)
 
     # Contract Data
-    @st.cache_data(ttl=300)
-    def get_contract(_self, contract_id: str) -> Dict[str, Any]:
+    @_degrade(DegradedDict)
+    @_cached(ttl=300)
+    def get_contract(self, contract_id: str) -> Dict[str, Any]:
         """Get contract details."""
-        response = _self._request("GET", f"/api/contracts/{contract_id}")
-        return response.json()
+        response = self._request("GET", f"/api/contracts/{contract_id}")
+        return _json(response)
 
+    @_degrade(DegradedDict)
     def get_budget(self, budget_id: str) -> Dict[str, Any]:
         """Get budget details."""
         response = self._request("GET", f"/api/budgets/{budget_id}")
-        return response.json()
+        return _json(response)
 
+    @_degrade(DegradedDict)
     def get_project_budgets(self, project_id: str) -> Dict[str, Any]:
         """Get all budgets for a project."""
         response = self._request("GET", f"/api/budgets/project/{project_id}")
-        return response.json()
+        return _json(response)
 
+    @_degrade(DegradedDict)
     def get_budget_variance(self, budget_id: str) -> Dict[str, Any]:
         """Get budget variance analysis."""
         response = self._request("GET", f"/api/budgets/{budget_id}/variance")
-        return response.json()
+        return _json(response)
 
     # Authentication
     def login(self, username: str, password: str) -> str:
@@ -166,7 +484,7 @@ class APIClient:
             "/api/auth/login",
             data={"username": username, "password": password},
         )
-        token = response.json()["access_token"]
+        token = _json(response)["access_token"]
         self.token = token
         return token
 
@@ -177,30 +495,31 @@ class APIClient:
             "/api/auth/register",
             json={"username": username, "password": password},
         )
-        token = response.json().get("access_token", "")
+        token = _json(response).get("access_token", "")
         self.token = token
         return token
 
     def me(self) -> Dict[str, Any]:
         """GET /api/auth/me. Returns {id, username}."""
         response = self._request("GET", "/api/auth/me")
-        return response.json()
+        return _json(response)
 
     # Conversation management
     def create_conversation(self) -> Dict[str, Any]:
         """Create a new empty conversation."""
         response = self._request("POST", "/api/conversations")
-        return response.json()
+        return _json(response)
 
+    @_degrade(DegradedList)
     def list_conversations(self) -> List[Dict[str, Any]]:
         """List all conversations, most recent first."""
         response = self._request("GET", "/api/conversations")
-        return response.json()
+        return _json(response)
 
     def get_conversation(self, conversation_id: str) -> Dict[str, Any]:
         """Get a conversation with its full message history."""
         response = self._request("GET", f"/api/conversations/{conversation_id}")
-        return response.json()
+        return _json(response)
 
     def delete_conversation(self, conversation_id: str) -> None:
         """Delete a conversation and all its messages."""
@@ -215,7 +534,7 @@ class APIClient:
             f"/api/conversations/{conversation_id}/title",
             json={"title": title},
         )
-        return response.json()
+        return _json(response)
 
     # Phase 7: Conversational AI
     def send(
@@ -242,11 +561,12 @@ class APIClient:
             "conversation_id": conversation_id,
             "session_id": session_id or "",
         }
-        multipart_files = (
-            [("files", (f["name"], f["bytes"])) for f in files] if files else None
+        data, multipart_files, content_type = _multipart_body(data, files)
+        headers = {"Content-Type": content_type} if content_type else {}
+        response = self._request(
+            "POST", "/api/chat", data=data, files=multipart_files, headers=headers
         )
-        response = self._request("POST", "/api/chat", data=data, files=multipart_files)
-        return response.json()
+        return _json(response)
 
     def stream(
         self,
@@ -269,23 +589,22 @@ class APIClient:
         Yields:
             Parsed event dicts with "event" and "data" keys
         """
-        import json as _json
-
         url = f"{self.base_url}/api/chat/stream"
         data = {
             "message": message,
             "conversation_id": conversation_id,
             "session_id": session_id or "",
         }
-        multipart_files = (
-            [("files", (f["name"], f["bytes"])) for f in files] if files else None
-        )
+        headers = {**self._auth_headers(), "Accept": "text/event-stream"}
+        data, multipart_files, content_type = _multipart_body(data, files)
+        if content_type:
+            headers["Content-Type"] = content_type
         try:
-            with requests.post(
+            with self._session.post(
                 url,
                 data=data,
                 files=multipart_files,
-                headers=self._auth_headers(),
+                headers=headers,
                 stream=True,
                 timeout=self.timeout,
             ) as resp:
@@ -296,21 +615,36 @@ class APIClient:
                     line = raw.decode("utf-8", errors="replace")
                     if line.startswith("data: "):
                         try:
-                            yield _json.loads(line[6:])
-                        except _json.JSONDecodeError:
+                            yield _loads(line[6:])
+                        except json.JSONDecodeError:
                             continue
-        except requests.exceptions.ConnectionError:
-            st.error(f"❌ Cannot connect to backend at {self.base_url}")
-            st.info(
-                "Make sure the FastAPI server is running: `uvicorn backend.main:app --reload`"
-            )
-        except requests.exceptions.Timeout:
-            st.error(f"⏱️ Request timed out after {self.timeout}s")
-        except requests.exceptions.HTTPError as e:
-            st.error(f"❌ API Error: {e.response.status_code} - {e.response.text}")
+        except requests.exceptions.RequestException as e:
+            self._report(e)
 
     # Cache Management
-    @staticmethod
-    def clear_cache():
-        """Clear all cached API responses."""
-        st.cache_data.clear()
+    def clear_cache(self):
+        """Clear this client's cached API responses.
+
+        Page-level st.cache_data memos are process-wide, so pages clear their
+        own entries rather than wiping every session's cache from here.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+
+
+def get_api_client() -> APIClient:
+    """Return this browser session's APIClient, carrying the current auth token.
+
+    The client is kept in st.session_state so tokens never cross users; the
+    underlying connection pool is shared process-wide via _http_session().
+    """
+    if "api" not in st.session_state:
+        st.session_state.api = APIClient()
+    api: APIClient = st.session_state.api
+    token = st.session_state.get("token")
+    if token != api.token:
+        # Logout or a different login: drop the previous user's responses
+        with api._cache_lock:
+            api._cache.clear()
+        api.token = token
+    return api
@@ -4,10 +4,14 @@ Data Formatting Utilities
 Helper functions for displaying data in the Streamlit UI.
 """
 
+import warnings
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Dict, List
 from decimal import Decimal
 
+import pandas as pd
+
 
 def format_currency(amount: float | Decimal | str) -> str:
     """Format amount as currency."""
@@ -31,7 +35,7 @@ def format_datetime(dt: str | datetime) -> str:
     """Format datetime for display."""
     if isinstance(dt, str):
         try:
-            dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
+            dt = datetime.fromisoformat(dt)
         except ValueError:
             return dt
 
@@ -42,13 +46,37 @@ def format_date(dt: str | datetime) -> str:
     """Format date only."""
     if isinstance(dt, str):
         try:
-            dt = datetime.fromisoformat(dt.replace("Z", "+00:00"))
+            dt = datetime.fromisoformat(dt)
         except ValueError:
             return dt
 
     return dt.strftime("%Y-%m-%d")
 
 
+def format_currency_series(amounts: pd.Series) -> pd.Series:
+    """Format a column of amounts as currency; unparseable values become $0.00."""
+    values = pd.to_numeric(amounts, errors="coerce").fillna(0.0).astype("float64")
+    return values.map("${:,.2f}".format)
+
+
+def format_datetime_series(timestamps: pd.Series) -> pd.Series:
+    """Format a column of ISO timestamps like format_datetime, in one parse when possible.
+
+    Each value keeps its own wall-clock time. Unparseable values pass through.
+    """
+    # Mixed UTC offsets can't share one dtype without converting to UTC:
+    # pandas 3 raises, pandas 2 warns and returns an object column
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            parsed = pd.to_datetime(timestamps, format="ISO8601", errors="coerce")
+    except ValueError:
+        return timestamps.map(format_datetime)
+    if not pd.api.types.is_datetime64_any_dtype(parsed):
+        return timestamps.map(format_datetime)
+    return parsed.dt.strftime("%Y-%m-%d %H:%M:%S").where(parsed.notna(), timestamps)
+
+
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to human-readable string."""
     if seconds < 1:
@@ -63,33 +91,40 @@ def format_duration(seconds: float) -> str:
         return f"{hours:.1f}h"
 
 
+_SEVERITY_COLORS = MappingProxyType({
+    "low": "#90EE90",      # Light green
+    "medium": "#FFD700",   # Gold
+    "high": "#FF6B6B",     # Light red
+    "critical": "#DC143C", # Crimson
+})
+
+
 def get_severity_color(severity: str) -> str:
     """Get color for severity level."""
-    colors = {
-        "low": "#90EE90",      # Light green
-        "medium": "#FFD700",   # Gold
-        "high": "#FF6B6B",     # Light red
-        "critical": "#DC143C", # Crimson
-    }
-    return colors.get(severity.lower(), "#808080")
+    return _SEVERITY_COLORS.get(severity.lower(), "#808080")
+
+
+_STATUS_EMOJIS = MappingProxyType({
+    "processing": "⚙️",
+    "completed": "✅",
+    "quarantined": "⚠️",
+    "failed": "❌",
+    "pending": "⏳",
+})
 
 
 def get_status_emoji(status: str) -> str:
     """Get emoji for workflow status."""
-    emojis = {
-        "processing": "⚙️",
-        "completed": "✅",
-        "quarantined": "⚠️",
-        "failed": "❌",
-        "pending": "⏳",
-    }
-    return emojis.get(status.lower(), "❓")
+    return _STATUS_EMOJIS.get(status.lower(), "❓")
 
 
 def format_anomaly_type(anomaly_type: str) -> str:
     """Format anomaly type for display."""
-    # Convert snake_case to Title Case
-    return anomaly_type.replace("_", " ").title()
+    # Convert snake_case to Title Case; known types are precomputed
+    label = _ANOMALY_LABELS.get(anomaly_type)
+    if label is None:
+        label = anomaly_type.replace("_", " ").title()
+    return label
 
 
 def truncate_text(text: str, max_length: int = 50) -> str:
@@ -99,13 +134,16 @@ def truncate_text(text: str, max_length: int = 50) -> str:
     return text[: max_length - 3] + "..."
 
 
+_FILE_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in bytes to human-readable string."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
+    # Each unit is 2**10 of the previous, so the bit length picks it directly
+    idx = min((int(size_bytes).bit_length() - 1) // 10, len(_FILE_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_FILE_SIZE_UNITS[idx]}"
 
 
 def format_list(items: List[Any], separator: str = ", ") -> str:
@@ -123,11 +161,15 @@ def format_dict_table(data: Dict[str, Any]) -> str:
         # Format key
         formatted_key = key.replace("_", " ").title()
 
-        # Format value based on type
-        if isinstance(value, (float, Decimal)) and "amount" in key.lower():
-            formatted_value = format_currency(value)
-        elif isinstance(value, (float, Decimal)) and "rate" in key.lower():
-            formatted_value = format_percentage(value)
+        # Format value based on type; the key only refines numeric values
+        if isinstance(value, (float, Decimal)):
+            lowered = key.lower()
+            if "amount" in lowered:
+                formatted_value = format_currency(value)
+            elif "rate" in lowered:
+                formatted_value = format_percentage(value)
+            else:
+                formatted_value = str(value)
         elif isinstance(value, datetime):
             formatted_value = format_datetime(value)
         elif isinstance(value, list):
@@ -140,17 +182,23 @@ def format_dict_table(data: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+_ANOMALY_ICONS = MappingProxyType({
+    "duplicate": "📋",
+    "price_spike": "📈",
+    "missing_contract": "📄",
+    "date_mismatch": "📅",
+    "amount_discrepancy": "💰",
+    "retention_violation": "⚖️",
+    "price_mismatch": "💲",
+    "billing_cap_exceeded": "🚫",
+    "scope_violation": "🔍",
+})
+
+_ANOMALY_LABELS = MappingProxyType(
+    {k: k.replace("_", " ").title() for k in _ANOMALY_ICONS}
+)
+
+
 def get_anomaly_icon(anomaly_type: str) -> str:
     """Get icon for anomaly type."""
-    icons = {
-        "duplicate": "📋",
-        "price_spike": "📈",
-        "missing_contract": "📄",
-        "date_mismatch": "📅",
-        "amount_discrepancy": "💰",
-        "retention_violation": "⚖️",
-        "price_mismatch": "💲",
-        "billing_cap_exceeded": "🚫",
-        "scope_violation": "🔍",
-    }
-    return icons.get(anomaly_type, "⚠️")
+    return _ANOMALY_ICONS.get(anomaly_type, "⚠️")
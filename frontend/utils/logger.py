@@ -13,12 +13,16 @@ Usage (any page / component):
 """
 
 import sys
-from pathlib import Path
 
-# Ensure project root is on sys.path so voronode_logging is importable
-_project_root = Path(__file__).parent.parent.parent  # .../Voronode/
-if str(_project_root) not in sys.path:
-    sys.path.insert(0, str(_project_root))
+try:
+    import voronode_logging  # noqa: F401
+except ImportError:
+    # Not installed / not on sys.path: fall back to the project root (.../Voronode/)
+    from pathlib import Path
+
+    _project_root = str(Path(__file__).resolve().parents[2])
+    if _project_root not in sys.path:
+        sys.path.insert(0, _project_root)
 
 from voronode_logging import (
     VoronodeLogger,
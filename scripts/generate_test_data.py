@@ -1,6 +1,11 @@
 """Generate synthetic invoices, contracts, and budgets for testing"""
 
+import hashlib
+import io
+import math
 import sys
+import textwrap
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -9,58 +14,105 @@ from faker import Faker
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import inch
-import random
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 import json
+import numpy as np
 import pandas as pd
 
-fake = Faker()
+try:
+    # C serializer; writes the same 2-space-indented layout as json.dump
+    import orjson
+except ImportError:
+    orjson = None
+
+# Page geometry in points, shared by both PDF generators
+_MARGIN = 1 * inch          # left text column and bottom margin
+_ROW = 0.2 * inch           # compact list / wrapped text row
+_LINE = 0.25 * inch         # regular line spacing
+_GAP = 0.3 * inch           # space below a heading
+_SECTION = 0.4 * inch       # space before a new section
+_BLOCK = 0.5 * inch         # space before a table block
+_COL_QTY = 4 * inch         # invoice line-item columns
+_COL_PRICE = 5 * inch
+_COL_TOTAL = 6.5 * inch
+
+# Fixed seed so invoice fixtures are reproducible and the manifest key below
+# describes them fully
+SEED = 42
+
+
+def _dump(path: Path, obj) -> None:
+    """Write obj as 2-space-indented JSON in a single write."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(obj, indent=2))
+
+
+def _draw_by_font(c: canvas.Canvas, draws: list):
+    """Draw (font, x, y, text) strings as one text object per distinct font."""
+    by_font = {}
+    for font, x, y, text in draws:
+        by_font.setdefault(font, []).append((x, y, text))
+    for font, strings in by_font.items():
+        # One BT...ET block per font instead of one per drawString call
+        text_obj = c.beginText()
+        text_obj.setFont(*font)
+        for x, y, text in strings:
+            text_obj.setTextOrigin(x, y)
+            text_obj.textOut(text)
+        c.drawText(text_obj)
 
 
 def generate_invoice_pdf(output_path: Path, invoice_data: dict):
     """Create a PDF invoice using ReportLab"""
-    c = canvas.Canvas(str(output_path), pagesize=letter)
+    # Render into memory and write the finished PDF in one call
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=letter, pageCompression=1)
     width, height = letter
+    draws = []  # (font, x, y, text), emitted grouped by font
 
     # Header
-    c.setFont("Helvetica-Bold", 20)
-    c.drawString(1 * inch, height - 1 * inch, "INVOICE")
+    font = ("Helvetica-Bold", 20)
+    draws.append((font, _MARGIN, height - _MARGIN, "INVOICE"))
 
     # Invoice details
-    c.setFont("Helvetica", 12)
+    font = ("Helvetica", 12)
     y = height - 1.5 * inch
-    c.drawString(1 * inch, y, f"Invoice Number: {invoice_data['invoice_number']}")
-    y -= 0.3 * inch
-    c.drawString(1 * inch, y, f"Date: {invoice_data['date']}")
-    y -= 0.3 * inch
-    c.drawString(1 * inch, y, f"Contractor: {invoice_data['contractor_name']}")
-    y -= 0.3 * inch
-    c.drawString(1 * inch, y, f"Project: {invoice_data['project_name']}")
+    draws.append((font, _MARGIN, y, f"Invoice Number: {invoice_data['invoice_number']}"))
+    y -= _GAP
+    draws.append((font, _MARGIN, y, f"Date: {invoice_data['date']}"))
+    y -= _GAP
+    draws.append((font, _MARGIN, y, f"Contractor: {invoice_data['contractor_name']}"))
+    y -= _GAP
+    draws.append((font, _MARGIN, y, f"Project: {invoice_data['project_name']}"))
 
     # Line items header
-    y -= 0.5 * inch
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(1 * inch, y, "Description")
-    c.drawString(4 * inch, y, "Qty")
-    c.drawString(5 * inch, y, "Unit Price")
-    c.drawString(6.5 * inch, y, "Total")
+    y -= _BLOCK
+    font = ("Helvetica-Bold", 12)
+    draws.append((font, _MARGIN, y, "Description"))
+    draws.append((font, _COL_QTY, y, "Qty"))
+    draws.append((font, _COL_PRICE, y, "Unit Price"))
+    draws.append((font, _COL_TOTAL, y, "Total"))
 
     # Line items
-    c.setFont("Helvetica", 10)
-    y -= 0.3 * inch
+    font = ("Helvetica", 10)
+    y -= _GAP
     for item in invoice_data["line_items"]:
-        c.drawString(1 * inch, y, item["description"][:30])
-        c.drawString(4 * inch, y, str(item["quantity"]))
-        c.drawString(5 * inch, y, f"${item['unit_price']:.2f}")
-        c.drawString(6.5 * inch, y, f"${item['total']:.2f}")
-        y -= 0.25 * inch
+        draws.append((font, _MARGIN, y, item["description"][:30]))
+        draws.append((font, _COL_QTY, y, str(item["quantity"])))
+        draws.append((font, _COL_PRICE, y, f"${item['unit_price']:.2f}"))
+        draws.append((font, _COL_TOTAL, y, f"${item['total']:.2f}"))
+        y -= _LINE
 
     # Total
-    y -= 0.3 * inch
-    c.setFont("Helvetica-Bold", 14)
-    c.drawString(5.5 * inch, y, f"TOTAL: ${invoice_data['total_amount']:.2f}")
+    y -= _GAP
+    font = ("Helvetica-Bold", 14)
+    draws.append((font, 5.5 * inch, y, f"TOTAL: ${invoice_data['total_amount']:.2f}"))
 
+    _draw_by_font(c, draws)
     c.save()
+    output_path.write_bytes(buf.getvalue())
 
 
 # --- Static reference data for contracts, projects, contractors, budgets ---
@@ -105,6 +157,20 @@ CONTRACTORS = [
     {"id": "CONT-010", "name": "Holmes, Berry and Holt", "license_number": "LIC-2024-0010", "rating": 4.4},
 ]
 
+# Cost codes for construction, shared by invoices and contract documents
+COST_CODE_NAMES = {
+    "01-100": "Site Preparation",
+    "03-300": "Concrete Work",
+    "05-500": "Structural Steel",
+    "06-100": "Rough Carpentry",
+    "09-900": "Painting",
+    "15-100": "Plumbing",
+    "16-100": "Electrical",
+}
+
+PROJECT_BY_ID = {p["id"]: p for p in PROJECTS}
+CONTRACTOR_BY_ID = {c["id"]: c for c in CONTRACTORS}
+
 CONTRACTS = [
     {
         "contract_id": "CONTRACT-001",
@@ -191,173 +257,154 @@ BUDGETS = {
 
 def generate_contract_pdf(output_path: Path, contract_data: dict):
     """Create a PDF contract document using ReportLab."""
-    c = canvas.Canvas(str(output_path), pagesize=letter)
+    # Render into memory and write the finished PDF in one call
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=letter, pageCompression=1)
     width, height = letter
+    draws = []  # (font, x, y, text), emitted grouped by font
 
     # Find contractor and project names from reference data
-    contractor_name = "Unknown Contractor"
-    for cont in CONTRACTORS:
-        if cont["id"] == contract_data["contractor_id"]:
-            contractor_name = cont["name"]
-            break
-
-    project_name = "Unknown Project"
-    for proj in PROJECTS:
-        if proj["id"] == contract_data["project_id"]:
-            project_name = proj["name"]
-            break
+    contractor_name = CONTRACTOR_BY_ID.get(contract_data["contractor_id"], {}).get(
+        "name", "Unknown Contractor"
+    )
+    project_name = PROJECT_BY_ID.get(contract_data["project_id"], {}).get(
+        "name", "Unknown Project"
+    )
 
     # Header
-    c.setFont("Helvetica-Bold", 20)
-    c.drawString(1 * inch, height - 1 * inch, "CONSTRUCTION CONTRACT")
+    font = ("Helvetica-Bold", 20)
+    draws.append((font, _MARGIN, height - _MARGIN, "CONSTRUCTION CONTRACT"))
 
-    c.setFont("Helvetica-Bold", 14)
+    font = ("Helvetica-Bold", 14)
     y = height - 1.4 * inch
-    c.drawString(1 * inch, y, f"Contract ID: {contract_data['contract_id']}")
+    draws.append((font, _MARGIN, y, f"Contract ID: {contract_data['contract_id']}"))
 
     # Parties
-    y -= 0.5 * inch
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(1 * inch, y, "PARTIES")
-    c.setFont("Helvetica", 11)
-    y -= 0.3 * inch
-    c.drawString(1 * inch, y, f"Contractor: {contractor_name} ({contract_data['contractor_id']})")
-    y -= 0.25 * inch
-    c.drawString(1 * inch, y, f"Project: {project_name} ({contract_data['project_id']})")
+    y -= _BLOCK
+    font = ("Helvetica-Bold", 12)
+    draws.append((font, _MARGIN, y, "PARTIES"))
+    font = ("Helvetica", 11)
+    y -= _GAP
+    draws.append((font, _MARGIN, y, f"Contractor: {contractor_name} ({contract_data['contractor_id']})"))
+    y -= _LINE
+    draws.append((font, _MARGIN, y, f"Project: {project_name} ({contract_data['project_id']})"))
 
     # Contract Value and Dates
-    y -= 0.4 * inch
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(1 * inch, y, "CONTRACT DETAILS")
-    c.setFont("Helvetica", 11)
-    y -= 0.3 * inch
-    c.drawString(1 * inch, y, f"Contract Value: ${contract_data['value']:,.2f}")
-    y -= 0.25 * inch
-    c.drawString(1 * inch, y, f"Start Date: {contract_data['start_date']}")
-    y -= 0.25 * inch
-    c.drawString(1 * inch, y, f"End Date: {contract_data['end_date']}")
+    y -= _SECTION
+    font = ("Helvetica-Bold", 12)
+    draws.append((font, _MARGIN, y, "CONTRACT DETAILS"))
+    font = ("Helvetica", 11)
+    y -= _GAP
+    draws.append((font, _MARGIN, y, f"Contract Value: ${contract_data['value']:,.2f}"))
+    y -= _LINE
+    draws.append((font, _MARGIN, y, f"Start Date: {contract_data['start_date']}"))
+    y -= _LINE
+    draws.append((font, _MARGIN, y, f"End Date: {contract_data['end_date']}"))
 
     # Scope of Work
-    y -= 0.4 * inch
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(1 * inch, y, "SCOPE OF WORK")
-    c.setFont("Helvetica", 11)
-    y -= 0.3 * inch
-
-    cost_code_names = {
-        "01-100": "Site Preparation",
-        "03-300": "Concrete Work",
-        "05-500": "Structural Steel",
-        "06-100": "Rough Carpentry",
-        "09-900": "Painting",
-        "15-100": "Plumbing",
-        "16-100": "Electrical",
-    }
-
-    c.drawString(1 * inch, y, "Approved Cost Codes:")
-    y -= 0.25 * inch
+    y -= _SECTION
+    font = ("Helvetica-Bold", 12)
+    draws.append((font, _MARGIN, y, "SCOPE OF WORK"))
+    font = ("Helvetica", 11)
+    y -= _GAP
+
+    draws.append((font, _MARGIN, y, "Approved Cost Codes:"))
+    y -= _LINE
     for code in contract_data.get("approved_cost_codes", []):
-        desc = cost_code_names.get(code, "Other")
-        c.drawString(1.3 * inch, y, f"- {code}: {desc}")
-        y -= 0.2 * inch
+        desc = COST_CODE_NAMES.get(code, "Other")
+        draws.append((font, 1.3 * inch, y, f"- {code}: {desc}"))
+        y -= _ROW
 
     # Unit Price Schedule
     schedule = contract_data.get("unit_price_schedule", {})
     if schedule:
-        y -= 0.3 * inch
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(1 * inch, y, "UNIT PRICE SCHEDULE")
-        c.setFont("Helvetica-Bold", 10)
-        y -= 0.3 * inch
-        c.drawString(1 * inch, y, "Cost Code")
-        c.drawString(2.5 * inch, y, "Description")
-        c.drawString(5 * inch, y, "Max Unit Price")
-
-        c.setFont("Helvetica", 10)
-        y -= 0.25 * inch
+        y -= _GAP
+        font = ("Helvetica-Bold", 12)
+        draws.append((font, _MARGIN, y, "UNIT PRICE SCHEDULE"))
+        font = ("Helvetica-Bold", 10)
+        y -= _GAP
+        draws.append((font, _MARGIN, y, "Cost Code"))
+        draws.append((font, 2.5 * inch, y, "Description"))
+        draws.append((font, 5 * inch, y, "Max Unit Price"))
+
+        font = ("Helvetica", 10)
+        y -= _LINE
         for code, price in schedule.items():
-            desc = cost_code_names.get(code, "Other")
-            c.drawString(1 * inch, y, code)
-            c.drawString(2.5 * inch, y, desc)
-            c.drawString(5 * inch, y, f"${price:,.2f}")
-            y -= 0.2 * inch
+            desc = COST_CODE_NAMES.get(code, "Other")
+            draws.append((font, _MARGIN, y, code))
+            draws.append((font, 2.5 * inch, y, desc))
+            draws.append((font, 5 * inch, y, f"${price:,.2f}"))
+            y -= _ROW
 
     # Payment Terms
-    y -= 0.3 * inch
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(1 * inch, y, "PAYMENT TERMS")
-    c.setFont("Helvetica", 11)
-    y -= 0.3 * inch
+    y -= _GAP
+    font = ("Helvetica-Bold", 12)
+    draws.append((font, _MARGIN, y, "PAYMENT TERMS"))
+    font = ("Helvetica", 11)
+    y -= _GAP
     retention_pct = contract_data["retention_rate"] * 100
-    c.drawString(1 * inch, y, f"Retention Rate: {retention_pct:.0f}%")
-    y -= 0.25 * inch
-    c.drawString(
-        1 * inch, y,
-        f"A retention of {retention_pct:.0f}% shall be withheld from each progress payment"
-    )
-    y -= 0.25 * inch
-    c.drawString(1 * inch, y, "until substantial completion of the work.")
+    draws.append((font, _MARGIN, y, f"Retention Rate: {retention_pct:.0f}%"))
+    y -= _LINE
+    draws.append((
+        font, _MARGIN, y,
+        f"A retention of {retention_pct:.0f}% shall be withheld from each progress payment",
+    ))
+    y -= _LINE
+    draws.append((font, _MARGIN, y, "until substantial completion of the work."))
 
     # General Terms
-    y -= 0.4 * inch
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(1 * inch, y, "GENERAL TERMS")
-    c.setFont("Helvetica", 10)
-    y -= 0.3 * inch
-
-    terms_text = contract_data.get("terms", "")
-    # Wrap long terms text
-    max_chars = 80
-    while terms_text and y > 1 * inch:
-        line = terms_text[:max_chars]
-        if len(terms_text) > max_chars:
-            # Break at last space
-            space_idx = line.rfind(" ")
-            if space_idx > 0:
-                line = terms_text[:space_idx]
-                terms_text = terms_text[space_idx + 1:]
-            else:
-                terms_text = terms_text[max_chars:]
-        else:
-            terms_text = ""
-        c.drawString(1 * inch, y, line)
-        y -= 0.2 * inch
-
+    y -= _SECTION
+    font = ("Helvetica-Bold", 12)
+    draws.append((font, _MARGIN, y, "GENERAL TERMS"))
+    font = ("Helvetica", 10)
+    y -= _GAP
+
+    # Wrap long terms text, keeping only the lines that fit above the margin
+    leading = _ROW
+    max_lines = max(0, math.ceil((y - _MARGIN) / leading))
+    terms_lines = textwrap.wrap(contract_data.get("terms", ""), width=80)[:max_lines]
+    terms = c.beginText(_MARGIN, y)
+    terms.setFont(*font)
+    terms.setLeading(leading)
+    terms.textLines(terms_lines)
+    c.drawText(terms)
+
+    _draw_by_font(c, draws)
     c.save()
+    output_path.write_bytes(buf.getvalue())
 
 
 def generate_projects(fixtures_dir: Path):
     """Write projects.json fixture."""
     path = fixtures_dir / "projects.json"
-    with open(path, "w") as f:
-        json.dump(PROJECTS, f, indent=2)
+    _dump(path, PROJECTS)
     print(f"Generated: {path.name} ({len(PROJECTS)} projects)")
 
 
 def generate_contractors(fixtures_dir: Path):
     """Write contractors.json fixture."""
     path = fixtures_dir / "contractors.json"
-    with open(path, "w") as f:
-        json.dump(CONTRACTORS, f, indent=2)
+    _dump(path, CONTRACTORS)
     print(f"Generated: {path.name} ({len(CONTRACTORS)} contractors)")
 
 
 def generate_contracts(contracts_dir: Path):
     """Write individual contract JSON fixtures."""
-    for contract in CONTRACTS:
-        path = contracts_dir / f"{contract['contract_id']}.json"
-        with open(path, "w") as f:
-            json.dump(contract, f, indent=2)
+    paths = [contracts_dir / f"{c['contract_id']}.json" for c in CONTRACTS]
+    # Small independent files: overlap their creates/writes on threads
+    with ThreadPoolExecutor() as pool:
+        list(pool.map(_dump, paths, CONTRACTS))
+    for path in paths:
         print(f"Generated: {path.name}")
     print(f"  -> {len(CONTRACTS)} contracts in {contracts_dir}")
 
 
 def generate_budgets(budgets_dir: Path):
     """Write per-project budget JSON fixtures."""
-    for project_id, lines in BUDGETS.items():
-        path = budgets_dir / f"{project_id}-budgets.json"
-        with open(path, "w") as f:
-            json.dump(lines, f, indent=2)
+    paths = [budgets_dir / f"{project_id}-budgets.json" for project_id in BUDGETS]
+    with ThreadPoolExecutor() as pool:
+        list(pool.map(_dump, paths, BUDGETS.values()))
+    for path, lines in zip(paths, BUDGETS.values()):
         print(f"Generated: {path.name} ({len(lines)} budget lines)")
 
 
@@ -365,25 +412,20 @@ def generate_budget_excel_files(budgets_dir: Path):
     """Generate Excel budget files for upload testing."""
     for project_id, lines in BUDGETS.items():
         # Find project name
-        project_name = "Unknown Project"
-        for proj in PROJECTS:
-            if proj["id"] == project_id:
-                project_name = proj["name"]
-                break
-
-        # Create DataFrame from budget lines
-        # Include project info in first row as a comment/header
-        budget_data = []
-        for line in lines:
-            budget_data.append({
-                "Cost Code": line["cost_code"],
-                "Description": line["description"],
-                "Budget": line["allocated"],
-                "Spent": line["spent"],
-                "Remaining": line["remaining"],
-            })
-
-        df = pd.DataFrame(budget_data)
+        project_name = PROJECT_BY_ID.get(project_id, {}).get("name", "Unknown Project")
+
+        # Create DataFrame straight from the budget line records, keeping
+        # only the upload columns and renaming them to the sheet headers
+        df = pd.DataFrame.from_records(
+            lines,
+            columns=["cost_code", "description", "allocated", "spent", "remaining"],
+        ).rename(columns={
+            "cost_code": "Cost Code",
+            "description": "Description",
+            "allocated": "Budget",
+            "spent": "Spent",
+            "remaining": "Remaining",
+        })
 
         # Generate Excel file
         excel_path = budgets_dir / f"{project_id}_Budget.xlsx"
@@ -401,7 +443,7 @@ def generate_budget_excel_files(budgets_dir: Path):
             })
             metadata_df.to_excel(writer, sheet_name="Metadata", index=False)
 
-        print(f"Generated Excel: {excel_path.name} ({len(budget_data)} lines)")
+        print(f"Generated Excel: {excel_path.name} ({len(df)} lines)")
 
         # Also generate CSV version for testing
         csv_path = budgets_dir / f"{project_id}_Budget.csv"
@@ -409,75 +451,119 @@ def generate_budget_excel_files(budgets_dir: Path):
         print(f"Generated CSV: {csv_path.name}")
 
 
+def _manifest_key(today: date) -> str:
+    """Hash everything the fixtures are derived from.
+
+    Covers the reference data, the seed, this script's source, and today's
+    date, since invoice dates count back from today.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    inputs = [PROJECTS, CONTRACTORS, CONTRACTS, BUDGETS, SEED, today.isoformat()]
+    digest.update(json.dumps(inputs, sort_keys=True).encode())
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
 def main():
     fixtures_dir = Path(__file__).parent.parent / "backend/tests/fixtures"
     invoices_dir = fixtures_dir / "invoices"
     contracts_dir = fixtures_dir / "contracts"
     budgets_dir = fixtures_dir / "budgets"
 
+    # Skip the whole run when nothing the fixtures depend on has changed;
+    # delete the manifest to force regeneration
+    manifest_path = fixtures_dir / ".manifest"
+    # Invoice dates count back from the run date, read once so the manifest
+    # key and the generated dates always agree
+    today = date.today()
+    manifest_key = _manifest_key(today)
+    if manifest_path.exists() and manifest_path.read_text() == manifest_key:
+        print(f"Fixtures in {fixtures_dir} are up to date")
+        return
+
+    Faker.seed(SEED)
+
     # Create directories
     invoices_dir.mkdir(parents=True, exist_ok=True)
     contracts_dir.mkdir(parents=True, exist_ok=True)
     budgets_dir.mkdir(parents=True, exist_ok=True)
 
     # Cost codes for construction
-    cost_codes = [
-        ("01-100", "Site Preparation"),
-        ("03-300", "Concrete Work"),
-        ("05-500", "Structural Steel"),
-        ("06-100", "Rough Carpentry"),
-        ("09-900", "Painting"),
-        ("15-100", "Plumbing"),
-        ("16-100", "Electrical"),
-    ]
-
-    # Generate 10 invoices
-    for i in range(1, 11):
+    cost_codes = list(COST_CODE_NAMES.items())
+
+    # Generate 10 invoices; Faker names are drawn in one batch up front. Faker
+    # is built here rather than at import so spawned PDF workers, which only
+    # render precomputed data, never pay its locale setup
+    fake = Faker()
+    n_invoices = 10
+    companies = [fake.company() for _ in range(n_invoices)]
+    cities = [fake.city() for _ in range(n_invoices)]
+
+    # Draw every invoice's line items in one batch: item counts per invoice,
+    # then cost codes, quantities and prices for all items at once
+    rng = np.random.default_rng(SEED)
+    counts = rng.integers(2, 6, size=n_invoices)
+    n_items = int(counts.sum())
+    code_idx = rng.integers(0, len(cost_codes), size=n_items)
+    qtys = rng.integers(1, 101, size=n_items)
+    prices = np.round(rng.uniform(50, 500, size=n_items), 2)
+    totals = np.round(qtys * prices, 2)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    invoice_totals = np.add.reduceat(totals, starts)
+    ages = rng.integers(1, 61, size=n_invoices)
+
+    # Back to Python scalars for the JSON fixtures and PDF workers
+    code_idx, qtys, prices, totals = (
+        code_idx.tolist(), qtys.tolist(), prices.tolist(), totals.tolist()
+    )
+
+    invoice_jobs = []
+    for i, contractor_name, city, start, count, amount, age in zip(
+        range(1, n_invoices + 1),
+        companies,
+        cities,
+        starts.tolist(),
+        counts.tolist(),
+        invoice_totals.tolist(),
+        ages.tolist(),
+    ):
         invoice_number = f"INV-2024-{i:04d}"
-        contractor_name = fake.company()
-        project_name = f"Project {fake.city()} Tower"
-
-        # Random line items
-        line_items = []
-        for _ in range(random.randint(2, 5)):
-            cost_code, description = random.choice(cost_codes)
-            qty = random.randint(1, 100)
-            unit_price = round(random.uniform(50, 500), 2)
-            total = round(qty * unit_price, 2)
-
-            line_items.append(
-                {
-                    "cost_code": cost_code,
-                    "description": description,
-                    "quantity": qty,
-                    "unit_price": unit_price,
-                    "total": total,
-                }
-            )
+        project_name = f"Project {city} Tower"
+
+        line_items = [
+            {
+                "cost_code": cost_codes[code_idx[j]][0],
+                "description": cost_codes[code_idx[j]][1],
+                "quantity": qtys[j],
+                "unit_price": prices[j],
+                "total": totals[j],
+            }
+            for j in range(start, start + count)
+        ]
 
         invoice_data = {
             "invoice_number": invoice_number,
-            "date": (datetime.now() - timedelta(days=random.randint(1, 60))).strftime(
-                "%Y-%m-%d"
-            ),
+            "date": (today - timedelta(days=age)).isoformat(),
             "contractor_name": contractor_name,
             "project_name": project_name,
             "line_items": line_items,
-            "total_amount": sum(item["total"] for item in line_items),
+            "total_amount": amount,
         }
 
-        # Generate PDF
-        pdf_path = invoices_dir / f"{invoice_number}.pdf"
-        generate_invoice_pdf(pdf_path, invoice_data)
-
-        # Save metadata as JSON
+        # Save metadata as JSON; the PDF is rendered below
         json_path = invoices_dir / f"{invoice_number}.json"
-        with open(json_path, "w") as f:
-            json.dump(invoice_data, f, indent=2)
+        _dump(json_path, invoice_data)
+
+        invoice_jobs.append((invoices_dir / f"{invoice_number}.pdf", invoice_data))
 
+    # ReportLab rendering is CPU-bound and independent per file, so spread it
+    # across processes; all random data was drawn above in this process
+    with ProcessPoolExecutor() as pool:
+        list(pool.map(generate_invoice_pdf, *zip(*invoice_jobs)))
+    for pdf_path, _ in invoice_jobs:
         print(f"Generated: {pdf_path.name}")
 
-    print(f"\nGenerated 10 test invoices in {invoices_dir}")
+    print(f"\nGenerated {n_invoices} test invoices in {invoices_dir}")
 
     # Generate contracts, projects, contractors, budgets
     generate_projects(fixtures_dir)
@@ -487,13 +573,15 @@ def main():
     generate_budget_excel_files(budgets_dir)
 
     # Generate contract PDFs
-    for contract in CONTRACTS:
-        pdf_path = contracts_dir / f"{contract['contract_id']}.pdf"
-        generate_contract_pdf(pdf_path, contract)
+    contract_paths = [contracts_dir / f"{c['contract_id']}.pdf" for c in CONTRACTS]
+    with ProcessPoolExecutor() as pool:
+        list(pool.map(generate_contract_pdf, contract_paths, CONTRACTS))
+    for pdf_path in contract_paths:
         print(f"Generated: {pdf_path.name}")
 
     print(f"\nGenerated {len(CONTRACTS)} contract PDFs in {contracts_dir}")
 
+    manifest_path.write_text(manifest_key)
     print(f"\nAll fixtures generated in {fixtures_dir}")
 
 
@@ -25,16 +25,15 @@ def main():
 
     logger.info("neo4j_connected")
 
-    # Run migration
     migration_path = (
         Path(__file__).parent.parent / "backend/graph/migrations/v1_initial.cypher"
     )
-    client.run_migration(str(migration_path))
+    # Run migration and verify constraints were created, on one session
+    constraints = client.run_script_then_query(
+        str(migration_path), "SHOW CONSTRAINTS"
+    )
 
     logger.info("schema_created_successfully")
-
-    # Verify constraints were created
-    constraints = client.run_query("SHOW CONSTRAINTS")
     logger.info("constraints_created", count=len(constraints))
 
     client.close()
@@ -4,7 +4,7 @@ voronode_logging — Structured logging for the Voronode platform.
 Provides:
 - VoronodeLogger: configure once, get per-module loggers anywhere
 - get_logger(): drop-in for structlog.get_logger() (accepts key=value kwargs)
-- CorrelationMiddleware: FastAPI middleware for request correlation IDs
+- CorrelationMiddleware: ASGI middleware for request correlation IDs
 - LogContext: context manager for temporary per-block log fields
 - LogLevel, TimedOperation: supporting types
 
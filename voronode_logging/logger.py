@@ -10,11 +10,17 @@ import logging
 import os
 import sys
 import time
-from contextvars import ContextVar
-from datetime import datetime, timezone
+import traceback
+from contextvars import ContextVar, Token
 from enum import Enum
 from typing import Any, Dict, Optional, Type, Union
 
+try:
+    # C encoder for the production JSON path; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ── Context variables ─────────────────────────────────────────────────────────
 
@@ -24,6 +30,32 @@ correlation_id_var: ContextVar[Optional[str]] = ContextVar(
 log_context_var: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
 
 
+def _fast_iso(ts: float) -> str:
+    """
+    Format an epoch timestamp as UTC ISO-8601 with microseconds.
+
+    Matches datetime.isoformat() for UTC ("+00:00" suffix), except that the
+    microseconds are always present, and avoids building a datetime per record.
+    """
+    t = time.gmtime(ts)
+    us = int((ts - int(ts)) * 1_000_000)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{us:06d}+00:00"
+    )
+
+
+def _dumps(entry: Dict[str, Any]) -> str:
+    """Serialize a log entry to compact JSON, falling back to stdlib json."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, default=str).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits, which orjson rejects
+            pass
+    return json.dumps(entry, default=str)
+
+
 # ── ANSI colors ───────────────────────────────────────────────────────────────
 
 
@@ -50,6 +82,13 @@ class _Colors:
     }
 
 
+# Colored, padded level badges for the dev printer, built once
+_LEVEL_BADGES: Dict[str, str] = {
+    level: f"{color}{_Colors.BOLD}{level:<5}{_Colors.RESET}"
+    for level, color in _Colors.LEVEL_MAP.items()
+}
+
+
 # ── Public types ──────────────────────────────────────────────────────────────
 
 
@@ -70,11 +109,12 @@ class LogContext:
 
     def __init__(self, **kwargs: Any) -> None:
         self.new_context = kwargs
-        self.previous_context: Dict[str, Any] = {}
+        self._token: Optional[Token[Dict[str, Any]]] = None
 
     def __enter__(self) -> "LogContext":
-        self.previous_context = log_context_var.get().copy()
-        log_context_var.set({**self.previous_context, **self.new_context})
+        self._token = log_context_var.set(
+            {**log_context_var.get(), **self.new_context}
+        )
         return self
 
     def __exit__(
@@ -83,7 +123,9 @@ class LogContext:
         exc_val: Optional[BaseException],
         exc_tb: Any,
     ) -> bool:
-        log_context_var.set(self.previous_context)
+        if self._token is not None:
+            log_context_var.reset(self._token)
+            self._token = None
         return False
 
 
@@ -114,38 +156,42 @@ class StructuredFormatter(logging.Formatter):
         level_name = record.levelname.upper()
         if level_name == "WARNING":
             level_name = "WARN"
+        name = record.name
 
         entry: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _fast_iso(record.created),
             "level": level_name,
             "service": self.service_name,
             "message": record.getMessage(),
         }
 
         # Class name from logger hierarchy  e.g.  voronode-api.orchestrator → orchestrator
-        if record.name and record.name != "root":
-            parts = record.name.split(".")
-            entry["class"] = parts[-1] if parts else record.name
+        if name and name != "root":
+            entry["class"] = name.rpartition(".")[2]
 
         # Correlation ID injected by CorrelationMiddleware
         correlation_id = correlation_id_var.get()
         if correlation_id:
             entry["correlationId"] = correlation_id
 
-        # Optional method name passed via _log()
-        if hasattr(record, "method_name") and record.method_name:
-            entry["method"] = record.method_name
-
-        # Merged context: global (LogContext) + per-call
-        context = log_context_var.get().copy()
-        if hasattr(record, "log_context") and record.log_context:
-            context.update(record.log_context)
+        # Optional method name passed via _log() (absent on plain stdlib records)
+        method_name = getattr(record, "method_name", None)
+        if method_name:
+            entry["method"] = method_name
+
+        # Merged context: global (LogContext) + per-call. Context dicts are
+        # never mutated in place, so the global one is only copied on merge
+        context = log_context_var.get()
+        extra_context = getattr(record, "log_context", None)
+        if extra_context:
+            context = {**context, **extra_context}
         if context:
             entry["context"] = context
 
         # Duration in ms (for timed operations)
-        if hasattr(record, "duration") and record.duration is not None:
-            entry["duration"] = record.duration
+        duration = getattr(record, "duration", None)
+        if duration is not None:
+            entry["duration"] = duration
 
         # Exception info
         if record.exc_info:
@@ -155,8 +201,6 @@ class StructuredFormatter(logging.Formatter):
                 "message": str(exc_value) if exc_value else "",
             }
             if self._is_dev:
-                import traceback
-
                 entry["error"]["stack"] = "".join(
                     traceback.format_exception(exc_type, exc_value, exc_tb)
                 )
@@ -169,7 +213,9 @@ class StructuredFormatter(logging.Formatter):
     def _pretty(entry: Dict[str, Any]) -> str:
         C = _Colors
         level = entry.get("level", "INFO")
-        level_color = C.LEVEL_MAP.get(level, C.INFO)
+        level_badge = _LEVEL_BADGES.get(level)
+        if level_badge is None:
+            level_badge = f"{C.INFO}{C.BOLD}{level:<5}{C.RESET}"
 
         ts_raw = entry.get("timestamp", "")
         try:
@@ -177,7 +223,6 @@ class StructuredFormatter(logging.Formatter):
         except (IndexError, AttributeError):
             ts = ts_raw
 
-        level_badge = f"{level_color}{C.BOLD}{level:<5}{C.RESET}"
         parts = [f"{C.TIMESTAMP}{ts}{C.RESET}", level_badge]
 
         service = entry.get("service", "")
@@ -206,8 +251,10 @@ class StructuredFormatter(logging.Formatter):
         ctx = entry.get("context")
         if ctx:
             lines.append(f"    {C.KEY}context:{C.RESET}")
-            for k, v in ctx.items():
-                lines.append(f"      {C.KEY}{k}:{C.RESET} {C.VALUE}{v}{C.RESET}")
+            lines.extend(
+                f"      {C.KEY}{k}:{C.RESET} {C.VALUE}{v}{C.RESET}"
+                for k, v in ctx.items()
+            )
 
         err = entry.get("error")
         if err:
@@ -217,8 +264,10 @@ class StructuredFormatter(logging.Formatter):
             )
             stack = err.get("stack")
             if stack:
-                for sline in stack.strip().splitlines():
-                    lines.append(f"      {C.DIM}{sline}{C.RESET}")
+                lines.extend(
+                    f"      {C.DIM}{sline}{C.RESET}"
+                    for sline in stack.strip().splitlines()
+                )
 
         return "\n".join(lines)
 
@@ -228,7 +277,7 @@ class StructuredFormatter(logging.Formatter):
         entry = self._build_entry(record)
         if self._is_dev:
             return self._pretty(entry)
-        return json.dumps(entry, default=str)
+        return _dumps(entry)
 
 
 # ── VoronodeLogger ────────────────────────────────────────────────────────────
@@ -249,6 +298,8 @@ class VoronodeLogger:
     _service_name: Optional[str] = None
     _root_logger: Optional[logging.Logger] = None
     _min_level: LogLevel = LogLevel.INFO
+    # One instance per name, bound to the current root; reset by configure()
+    _instances: Dict[str, "VoronodeLoggerInstance"] = {}
 
     # Map LogLevel → stdlib logging integer, avoiding the deprecated logging.WARN alias
     _LEVEL_TO_INT: Dict[str, int] = {
@@ -292,7 +343,18 @@ class VoronodeLogger:
         logger.addHandler(handler)
         logger.propagate = False
 
+        # StructuredFormatter never reads caller file/line, thread, process
+        # or task fields, so skip collecting them for every record. This is
+        # process-wide: other loggers lose those fields too (they read as
+        # "(unknown file)" / None).
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        logging.logAsyncioTasks = False
+        logging._srcfile = None  # disables the findCaller() stack walk
+
         cls._root_logger = logger
+        cls._instances = {}
         return logger
 
     @classmethod
@@ -302,8 +364,13 @@ class VoronodeLogger:
             cls.configure("voronode")
 
         name = context if isinstance(context, str) else context.__name__
-        child_logger = cls._root_logger.getChild(name)
-        return VoronodeLoggerInstance(child_logger, name)
+        instance = cls._instances.get(name)
+        if instance is None:
+            child_logger = cls._root_logger.getChild(name)
+            instance = cls._instances.setdefault(
+                name, VoronodeLoggerInstance(child_logger, name)
+            )
+        return instance
 
     @classmethod
     def set_correlation_id(cls, correlation_id: str) -> None:
@@ -318,9 +385,7 @@ class VoronodeLogger:
     @classmethod
     def set_context(cls, **kwargs: Any) -> None:
         """Add fields included in all subsequent logs in this context."""
-        current = log_context_var.get().copy()
-        current.update(kwargs)
-        log_context_var.set(current)
+        log_context_var.set({**log_context_var.get(), **kwargs})
 
     @classmethod
     def clear_context(cls) -> None:
@@ -344,6 +409,8 @@ class VoronodeLoggerInstance:
         error: Optional[Exception] = None,
         duration: Optional[int] = None,
     ) -> None:
+        if not self._logger.isEnabledFor(level):
+            return
         extra = {
             "method_name": method,
             "log_context": context if isinstance(context, dict) else {},
@@ -424,7 +491,8 @@ class TimedOperation:
 
     def __enter__(self) -> "TimedOperation":
         self.start_time = time.time()
-        self.logger.info(f"{self.operation} started", context=self.context)
+        if self.logger._logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"{self.operation} started", context=self.context)
         return self
 
     def __exit__(
@@ -469,25 +537,39 @@ class _CompatLogger:
     def _extract(
         self, kwargs: Dict[str, Any]
     ) -> tuple[Optional[Exception], Optional[str], Optional[Dict[str, Any]]]:
-        raw_error = kwargs.pop("error", None)
+        # kwargs is the fresh dict built for this call's **kwargs, so it is
+        # trimmed in place rather than copied
         error: Optional[Exception] = None
+        raw_error = kwargs.get("error")
         if isinstance(raw_error, Exception):
-            error = raw_error
+            error = kwargs.pop("error")
         elif raw_error is not None:
             kwargs["error"] = str(raw_error)  # surface string errors in context
+        else:
+            kwargs.pop("error", None)
 
         method = kwargs.pop("method", None)
         return error, method, (kwargs or None)
 
+    def _enabled(self, level: int) -> bool:
+        # Checked before _extract so dropped records skip the kwargs rework
+        return self._instance._logger.isEnabledFor(level)
+
     def debug(self, event: str, **kwargs: Any) -> None:
+        if not self._enabled(logging.DEBUG):
+            return
         error, method, ctx = self._extract(kwargs)
         self._instance.debug(event, method=method, context=ctx)
 
     def info(self, event: str, **kwargs: Any) -> None:
+        if not self._enabled(logging.INFO):
+            return
         error, method, ctx = self._extract(kwargs)
         self._instance.info(event, method=method, context=ctx)
 
     def warn(self, event: str, **kwargs: Any) -> None:
+        if not self._enabled(logging.WARNING):
+            return
         error, method, ctx = self._extract(kwargs)
         self._instance.warn(event, method=method, context=ctx)
 
@@ -495,6 +577,8 @@ class _CompatLogger:
         self.warn(event, **kwargs)
 
     def error(self, event: str, **kwargs: Any) -> None:
+        if not self._enabled(logging.ERROR):
+            return
         error, method, ctx = self._extract(kwargs)
         self._instance.error(event, method=method, error=error, context=ctx)
 
@@ -505,6 +589,9 @@ class _CompatLogger:
         self.error(event, **kwargs)
 
 
+_compat_loggers: Dict[str, _CompatLogger] = {}
+
+
 def get_logger(name: Optional[str] = None) -> _CompatLogger:
     """
     Drop-in replacement for structlog.get_logger().
@@ -514,4 +601,9 @@ def get_logger(name: Optional[str] = None) -> _CompatLogger:
         logger.error("failed", error=exc)
     """
     class_name = name.split(".")[-1] if name and "." in name else (name or "app")
-    return _CompatLogger(VoronodeLogger.get(class_name))
+    instance = VoronodeLogger.get(class_name)
+    compat = _compat_loggers.get(class_name)
+    # A reconfigure swaps the instance; rewrap rather than serve a stale shim
+    if compat is None or compat._instance is not instance:
+        compat = _compat_loggers[class_name] = _CompatLogger(instance)
+    return compat
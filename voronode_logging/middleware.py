@@ -1,15 +1,43 @@
 """
-FastAPI / Starlette middleware for correlation ID propagation and HTTP request logging.
+ASGI middleware for correlation ID propagation and HTTP request logging.
 """
 
+import logging
+import os
+import secrets
 import time
-import uuid
-from typing import Callable, Optional
+from typing import Any, Awaitable, Callable, Dict, MutableMapping, Optional
+from urllib.parse import parse_qsl
 
 from .logger import VoronodeLogger, VoronodeLoggerInstance, correlation_id_var, log_context_var
 
 CORRELATION_ID_HEADER = "X-Correlation-ID"
 
+# ASGI header names are lowercase bytes
+_HEADER_KEY = CORRELATION_ID_HEADER.lower().encode("latin-1")
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+# "Request completed" carries method, path, status and duration, so the
+# start-of-request line is DEBUG-only unless operators opt back in
+_LOG_REQUEST_START = os.getenv("VORONODE_HTTP_LOG_BOTH", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Fresh per-request log context. Shared safely because context dicts are
+# replaced, never mutated in place.
+_EMPTY_CONTEXT: Dict[str, Any] = {}
+
+
+def _mint_id() -> str:
+    """New correlation ID: 64 random bits, hex-encoded."""
+    return "req-" + secrets.token_hex(8)
+
 
 def get_correlation_id() -> Optional[str]:
     """Return the correlation ID for the current request context."""
@@ -21,104 +49,124 @@ def set_correlation_id(correlation_id: str) -> None:
     correlation_id_var.set(correlation_id)
 
 
-try:
-    from fastapi import Request, Response
-    from starlette.middleware.base import BaseHTTPMiddleware
-
-    class CorrelationMiddleware(BaseHTTPMiddleware):
-        """
-        Middleware that:
-        1. Extracts or generates a correlation ID per request
-        2. Propagates it via contextvars so every log line includes it
-        3. Logs HTTP request start and completion with timing
-        4. Echoes the correlation ID back in response headers
-
-        Add to your FastAPI app:
-            app.add_middleware(CorrelationMiddleware)
-        """
-
-        def __init__(self, app) -> None:
-            super().__init__(app)
-            self._http_logger: Optional[VoronodeLoggerInstance] = None
-
-        @property
-        def _logger(self) -> Optional[VoronodeLoggerInstance]:
-            if self._http_logger is None:
-                try:
-                    self._http_logger = VoronodeLogger.get("HTTP")
-                except RuntimeError:
-                    return None
-            return self._http_logger
-
-        async def dispatch(self, request: Request, call_next: Callable) -> Response:
-            # Honour incoming correlation ID or mint a new one
-            correlation_id = request.headers.get(
-                CORRELATION_ID_HEADER, f"req-{uuid.uuid4()}"
-            )
-            correlation_id_var.set(correlation_id)
-            log_context_var.set({})
-
-            if self._logger:
-                self._logger.info(
+class CorrelationMiddleware:
+    """
+    Middleware that:
+    1. Extracts or generates a correlation ID per request
+    2. Propagates it via contextvars so every log line includes it
+    3. Logs HTTP request completion with timing (and the start at DEBUG,
+       or at INFO when VORONODE_HTTP_LOG_BOTH is set)
+    4. Echoes the correlation ID back in response headers
+
+    Written as plain ASGI rather than BaseHTTPMiddleware, so each request
+    runs in the caller's task without an extra task group or response
+    wrapper. Add to your FastAPI app:
+        app.add_middleware(CorrelationMiddleware)
+    """
+
+    def __init__(self, app: Callable[[Scope, Receive, Send], Awaitable[None]]) -> None:
+        self.app = app
+        self._http_logger: Optional[VoronodeLoggerInstance] = None
+        self._resolve_logger()
+
+    def _resolve_logger(self) -> Optional[VoronodeLoggerInstance]:
+        # VoronodeLogger may be configured after the middleware is built;
+        # retried until it succeeds, then the plain attribute is used
+        if self._http_logger is None:
+            try:
+                self._http_logger = VoronodeLogger.get("HTTP")
+            except RuntimeError:
+                pass
+        return self._http_logger
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Honour incoming correlation ID or mint a new one
+        correlation_id = None
+        for name, value in scope["headers"]:
+            if name == _HEADER_KEY:
+                correlation_id = value.decode("latin-1")
+                break
+        if correlation_id is None:
+            correlation_id = _mint_id()
+        cid_token = correlation_id_var.set(correlation_id)
+        ctx_token = log_context_var.set(_EMPTY_CONTEXT)
+
+        method = scope["method"]
+        path = scope["path"]
+        status_code = 500
+
+        async def send_with_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = [
+                    (k, v) for k, v in message.get("headers", ()) if k != _HEADER_KEY
+                ]
+                headers.append((_HEADER_KEY, correlation_id.encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        log = self._http_logger or self._resolve_logger()
+        start_time = time.time()
+        try:
+            if log and (
+                _LOG_REQUEST_START or log._logger.isEnabledFor(logging.DEBUG)
+            ):
+                # Only parse the query string when there is one
+                query_string = scope.get("query_string")
+                query = None
+                if query_string:
+                    query = dict(
+                        parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)
+                    )
+                log_start = log.info if _LOG_REQUEST_START else log.debug
+                log_start(
                     "Request received",
                     method="dispatch",
                     context={
-                        "method": request.method,
-                        "path": request.url.path,
-                        "query": dict(request.query_params) or None,
+                        "method": method,
+                        "path": path,
+                        "query": query or None,
                     },
                 )
 
-            start_time = time.time()
-            try:
-                response = await call_next(request)
-                duration = int((time.time() - start_time) * 1000)
-
-                if self._logger:
-                    log_fn = (
-                        self._logger.warn
-                        if response.status_code >= 400
-                        else self._logger.info
-                    )
-                    log_fn(
-                        "Request completed",
-                        method="dispatch",
-                        context={
-                            "method": request.method,
-                            "path": request.url.path,
-                            "statusCode": response.status_code,
-                            "duration": duration,
-                        },
-                    )
-
-                response.headers[CORRELATION_ID_HEADER] = correlation_id
-                return response
-
-            except Exception as e:
-                duration = int((time.time() - start_time) * 1000)
-                if self._logger:
-                    self._logger.error(
-                        "Request failed",
-                        method="dispatch",
-                        error=e,
-                        context={
-                            "method": request.method,
-                            "path": request.url.path,
-                            "duration": duration,
-                        },
-                    )
-                raise
-
-            finally:
-                correlation_id_var.set(None)
-                log_context_var.set({})
+            await self.app(scope, receive, send_with_id)
+            duration = int((time.time() - start_time) * 1000)
 
-except ImportError:
+            if log:
+                log_fn = log.warn if status_code >= 400 else log.info
+                log_fn(
+                    "Request completed",
+                    method="dispatch",
+                    context={
+                        "method": method,
+                        "path": path,
+                        "statusCode": status_code,
+                        "duration": duration,
+                    },
+                )
 
-    class CorrelationMiddleware:  # type: ignore
-        """Stub — FastAPI/Starlette is not installed."""
+        except Exception as e:
+            duration = int((time.time() - start_time) * 1000)
+            if log:
+                log.error(
+                    "Request failed",
+                    method="dispatch",
+                    error=e,
+                    context={
+                        "method": method,
+                        "path": path,
+                        "duration": duration,
+                    },
+                )
+            raise
 
-        def __init__(self, *args, **kwargs) -> None:
-            raise ImportError(
-                "fastapi and starlette are required to use CorrelationMiddleware"
-            )
+        finally:
+            # Restore whatever an outer context had set, rather than
+            # clobbering it with None / {}
+            correlation_id_var.reset(cid_token)
+            log_context_var.reset(ctx_token)